@@ -2,16 +2,32 @@
 #
 from __future__ import print_function
 
+import sys
+
 from .__about__ import __version__, __author__, __author_email__, __website__
 
 from . import built_in
 from . import opencascade
 from .helpers import generate_mesh, get_gmsh_major_version, rotation_matrix
+from .session import GmshSession
+from .batch import generate_mesh_sweep, generate_meshes
+from .hierarchy import generate_mesh_hierarchy
+from .cache import MeshCache
+from .gmsh_log import GmshError
+
+if sys.version_info >= (3, 5):
+    from .aio import generate_mesh_async
 
 __all__ = [
     "built_in",
     "opencascade",
     "generate_mesh",
+    "generate_meshes",
+    "generate_mesh_sweep",
+    "generate_mesh_hierarchy",
+    "GmshSession",
+    "MeshCache",
+    "GmshError",
     "get_gmsh_major_version",
     "rotation_matrix",
     "__version__",
@@ -20,6 +36,9 @@ __all__ = [
     "__website__",
 ]
 
+if sys.version_info >= (3, 5):
+    __all__.append("generate_mesh_async")
+
 try:
     import pipdate
 except ImportError:
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+# Requires Python 3.5+.
+#
+import asyncio
+import os
+import subprocess
+import tempfile
+
+from . import msh_io, performance
+from .gmsh_log import GmshLog
+from .helpers import (
+    _get_dim,
+    _get_gmsh_command,
+    _get_gmsh_exe,
+    _get_gmsh_version,
+    _get_parameter_arguments,
+    _postprocess,
+    _read_mesh,
+    _write_geo,
+)
+
+
+async def generate_mesh_async(
+    geo_object,
+    verbose=True,
+    dim=None,
+    prune_vertices=True,
+    remove_faces=False,
+    gmsh_path=None,
+    extra_gmsh_arguments=None,
+    fast_conversion=False,
+    index_dtype=None,
+    coord_dtype=None,
+    semaphore=None,
+    log_callback=None,
+    performance_profile=None,
+    num_threads=None,
+    only_physical=None,
+    cell_dims=None,
+    cache=None,
+    parameters=None,
+):
+    """Awaitable version of :func:`pygmsh.generate_mesh`; returns the same
+    tuple.
+
+    Gmsh runs as an asyncio subprocess whose output is streamed without
+    blocking the event loop; the geo file is written and the mesh file is read
+    in the loop's default executor. If the task is cancelled, the Gmsh child
+    process is killed.
+
+    :param semaphore: an optional :class:`asyncio.Semaphore` that bounds the
+        number of concurrently running Gmsh processes.
+    :param log_callback: called with every event parsed from Gmsh's output,
+        like in :func:`pygmsh.generate_mesh`.
+    :param performance_profile: see :func:`pygmsh.generate_mesh`.
+    :param num_threads: see :func:`pygmsh.generate_mesh`.
+    :param only_physical: see :func:`pygmsh.generate_mesh`.
+    :param cell_dims: see :func:`pygmsh.generate_mesh`.
+    :param cache: see :func:`pygmsh.generate_mesh`.
+    :param parameters: see :func:`pygmsh.generate_mesh`.
+    """
+    args = (
+        geo_object,
+        verbose,
+        dim,
+        prune_vertices,
+        remove_faces,
+        gmsh_path,
+        extra_gmsh_arguments,
+        fast_conversion,
+        index_dtype,
+        coord_dtype,
+        log_callback,
+        performance_profile,
+        num_threads,
+        only_physical,
+        cell_dims,
+        cache,
+        parameters,
+    )
+    if semaphore is None:
+        return await _generate_mesh_async(*args)
+
+    async with semaphore:
+        return await _generate_mesh_async(*args)
+
+
+async def _generate_mesh_async(
+    geo_object,
+    verbose,
+    dim,
+    prune_vertices,
+    remove_faces,
+    gmsh_path,
+    extra_gmsh_arguments,
+    fast_conversion,
+    index_dtype,
+    coord_dtype,
+    log_callback,
+    performance_profile,
+    num_threads,
+    only_physical,
+    cell_dims,
+    cache,
+    parameters,
+):
+    if extra_gmsh_arguments is None:
+        extra_gmsh_arguments = []
+    if parameters is not None:
+        extra_gmsh_arguments = extra_gmsh_arguments + _get_parameter_arguments(
+            parameters
+        )
+
+    filetype, suffix = ("vtk", ".vtk") if fast_conversion else ("msh", ".msh")
+    dim = _get_dim(geo_object, dim)
+    loop = asyncio.get_event_loop()
+
+    header = []
+    if performance_profile is not None or num_threads is not None:
+        header.append(performance.get_code(performance_profile, num_threads))
+    footer = []
+    if only_physical is not None or cell_dims is not None:
+        footer.append(geo_object._get_physical_selection_code(only_physical, cell_dims))
+
+    mesh = None
+    code = None
+    if cache is not None:
+        code = await loop.run_in_executor(None, geo_object.get_code)
+        gmsh_version = await loop.run_in_executor(
+            None,
+            _get_gmsh_version,
+            gmsh_path if gmsh_path is not None else _get_gmsh_exe(),
+        )
+        cache_key = cache.key(
+            "\n".join(header + [code] + footer),
+            dim,
+            extra_gmsh_arguments,
+            gmsh_version,
+            filetype,
+        )
+        mesh = await loop.run_in_executor(None, cache.load, cache_key)
+
+    if mesh is None:
+        mesh = await _run_gmsh_async(
+            geo_object,
+            code,
+            header,
+            footer,
+            dim,
+            filetype,
+            suffix,
+            gmsh_path,
+            extra_gmsh_arguments,
+            # Cached meshes keep their original types, cf. generate_mesh.
+            (None, None) if cache is not None else (index_dtype, coord_dtype),
+            GmshLog(verbose=verbose, callback=log_callback),
+        )
+        if cache is not None:
+            await loop.run_in_executor(None, cache.store, cache_key, mesh)
+
+    msh_io.convert_dtypes(mesh, index_dtype, coord_dtype)
+    _postprocess(mesh, remove_faces, prune_vertices)
+    return mesh.points, mesh.cells, mesh.point_data, mesh.cell_data, mesh.field_data
+
+
+async def _run_gmsh_async(
+    geo_object,
+    code,
+    header,
+    footer,
+    dim,
+    filetype,
+    suffix,
+    gmsh_path,
+    extra_gmsh_arguments,
+    dtypes,
+    log,
+):
+    with tempfile.NamedTemporaryFile(suffix=".geo") as f:
+        geo_filename = f.name
+    with tempfile.NamedTemporaryFile(suffix=suffix) as f:
+        msh_filename = f.name
+
+    command = _get_gmsh_command(
+        geo_filename, msh_filename, dim, filetype, gmsh_path, extra_gmsh_arguments
+    )
+
+    loop = asyncio.get_event_loop()
+    try:
+        await loop.run_in_executor(
+            None, _write_geo, geo_filename, geo_object, code, header, footer
+        )
+        p = await asyncio.create_subprocess_exec(
+            *command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT
+        )
+        try:
+            while True:
+                line = await p.stdout.readline()
+                if not line:
+                    break
+                log(line.decode("utf-8", "replace"))
+            await p.wait()
+        except asyncio.CancelledError:
+            try:
+                p.kill()
+            except ProcessLookupError:
+                # already gone
+                pass
+            await p.wait()
+            raise
+
+        if p.returncode != 0:
+            raise log.error(
+                "Gmsh exited with error (return code {}).".format(p.returncode),
+                returncode=p.returncode,
+            )
+
+        mesh = await loop.run_in_executor(
+            None, _read_mesh, msh_filename, filetype, dtypes[0], dtypes[1]
+        )
+    finally:
+        for filename in [geo_filename, msh_filename]:
+            if os.path.exists(filename):
+                os.remove(filename)
+    return mesh
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+#
+import itertools
+import multiprocessing
+import threading
+
+from .checkpoint import get_checkpoint_code
+from .gmsh_log import GmshLog
+from .helpers import generate_mesh
+
+
+class _CodeGeometry(object):
+    """Stand-in for a Geometry whose code has already been generated. Only
+    the code is sent to the worker processes; the Geometry objects themselves
+    stay in the parent process.
+    """
+
+    def __init__(self, code, dimension):
+        self.code = code
+        self.dimension = dimension
+        return
+
+    def get_code(self):
+        return self.code
+
+
+def _mesh_job(job):
+    k, code, dimension, kwargs = job
+    try:
+        out = generate_mesh(_CodeGeometry(code, dimension), **kwargs)
+    except Exception as e:  # pylint: disable=broad-except
+        return k, None, e
+    return k, out, None
+
+
+def generate_meshes(
+    geo_objects,
+    workers=None,
+    ordered=False,
+    num_threads=1,
+    chunk_size=None,
+    **kwargs
+):
+    """Mesh many independent geometries in parallel.
+
+    The code of every geometry is generated in the calling process, at most
+    `2 * workers` geometries ahead of the results that have been handed out,
+    and passed to a pool of `workers` processes, each of which runs
+    :func:`pygmsh.generate_mesh` on it. Results are yielded as tuples `(k,
+    mesh, error)` where `k` is the index of the geometry in `geo_objects`,
+    `mesh` is the return value of :func:`pygmsh.generate_mesh`, and `error`
+    is the exception raised by a failed job (in which case `mesh` is `None`).
+    A failing job doesn't abort the batch.
+
+    :param workers: number of worker processes; defaults to the number of
+        CPUs.
+    :param ordered: if `True`, yield results in the order of `geo_objects`;
+        otherwise yield them as they complete.
+    :param num_threads: maximum number of threads each Gmsh job may use. With
+        `workers` concurrent jobs, the default of 1 keeps the machine from
+        being oversubscribed. Passed on to :func:`pygmsh.generate_mesh`,
+        where it also caps the threads of the `performance_profile`.
+    :param chunk_size: if given, `geo_objects` is consumed and submitted in
+        chunks of this many geometries, each of which is finished before the
+        next one is started; `ordered=False` then only reorders within a
+        chunk.
+    :param kwargs: passed on to :func:`pygmsh.generate_mesh`.
+    """
+    # Don't print Gmsh output of concurrent jobs to the terminal by default.
+    kwargs.setdefault("verbose", False)
+    kwargs["num_threads"] = num_threads
+    get_code = _get_code_function(kwargs)
+
+    jobs = (
+        (k, get_code(g), getattr(g, "dimension", 3), kwargs)
+        for k, g in enumerate(geo_objects)
+    )
+    for result in _run_jobs(jobs, workers, ordered, chunk_size):
+        yield result
+    return
+
+
+def generate_mesh_sweep(
+    geo_object, parameter_sets, workers=None, ordered=False, num_threads=1, **kwargs
+):
+    """Mesh one geometry for many values of its parameters (see
+    :meth:`pygmsh.built_in.Geometry.parameter`) in parallel. The code of the
+    geometry is generated only once; the jobs merely set the parameters.
+
+    `parameter_sets` is a sequence of dictionaries that map parameter names to
+    values, each of which is passed to :func:`pygmsh.generate_mesh` as
+    `parameters`. Results are yielded like in :func:`generate_meshes`, `k`
+    being the index in `parameter_sets`. The other arguments are as in
+    :func:`generate_meshes`.
+    """
+    kwargs.setdefault("verbose", False)
+    kwargs["num_threads"] = num_threads
+    code = _get_code_function(kwargs)(geo_object)
+    dimension = getattr(geo_object, "dimension", 3)
+
+    jobs = (
+        (k, code, dimension, dict(kwargs, parameters=parameters))
+        for k, parameters in enumerate(parameter_sets)
+    )
+    return _run_jobs(jobs, workers, ordered, None)
+
+
+def _get_code_function(kwargs):
+    """Returns a function that generates the code of a geometry for the jobs.
+    The physical group selection and the checkpoint need the Geometry object,
+    so they're taken out of `kwargs` and handled here.
+    """
+    only_physical = kwargs.pop("only_physical", None)
+    cell_dims = kwargs.pop("cell_dims", None)
+    checkpoint_dir = kwargs.pop("checkpoint_dir", None)
+
+    def get_code(g):
+        if checkpoint_dir is not None:
+            code = get_checkpoint_code(
+                g, checkpoint_dir, GmshLog(), kwargs.get("gmsh_path")
+            )
+        else:
+            code = g.get_code()
+        if only_physical is not None or cell_dims is not None:
+            code += "\n" + g._get_physical_selection_code(only_physical, cell_dims)
+        return code
+
+    return get_code
+
+
+def _run_jobs(jobs, workers, ordered, chunk_size):
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    pool = multiprocessing.Pool(workers)
+    # Pool.imap drains its input in a separate thread as fast as it can, so the
+    # jobs (and with them the code of the geometries) are throttled: Only
+    # `2 * workers` of them are taken ahead of the results handed out.
+    slots = threading.Semaphore(2 * workers)
+    stopped = []
+
+    def throttle(jobs):
+        while True:
+            slots.acquire()
+            if stopped:
+                return
+            try:
+                job = next(jobs)
+            except StopIteration:
+                return
+            yield job
+
+    try:
+        imap = pool.imap if ordered else pool.imap_unordered
+        if chunk_size is None:
+            for result in imap(_mesh_job, throttle(jobs)):
+                slots.release()
+                yield result
+        else:
+            while True:
+                chunk = list(itertools.islice(jobs, chunk_size))
+                if not chunk:
+                    break
+                for result in imap(_mesh_job, chunk):
+                    yield result
+    finally:
+        # Wake up the pool's task handler if it waits for a slot.
+        stopped.append(True)
+        slots.release()
+        pool.terminate()
+        pool.join()
+    return
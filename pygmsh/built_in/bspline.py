@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 #
+from ..helpers import _new_id_code
+
 from .line_base import LineBase
 from .point import Point
 
@@ -14,21 +16,25 @@ class Bspline(LineBase):
         Contains the identification numbers of the control points.
     """
 
-    def __init__(self, control_points):
-        super(Bspline, self).__init__()
+    __slots__ = ("control_points",)
+
+    def __init__(self, control_points, id0=None):
+        super(Bspline, self).__init__(id0=id0)
 
         for c in control_points:
             assert isinstance(c, Point)
         assert len(control_points) > 1
 
-        self.control_points = control_points
+        self.control_points = list(control_points)
+        return
 
-        self.code = "\n".join(
-            [
-                "{} = newl;".format(self.id),
+    @property
+    def code(self):
+        return "\n".join(
+            _new_id_code(self.id, "newl")
+            + [
                 "BSpline({}) = {{{}}};".format(
                     self.id, ", ".join([c.id for c in self.control_points])
-                ),
+                )
             ]
         )
-        return
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 #
+from ..helpers import _new_id_code
+
 from .line_base import LineBase
 from .point import Point
 
@@ -18,8 +20,10 @@ class CircleArc(LineBase):
         Coordinates of end point needed to construct circle-arc.
     """
 
-    def __init__(self, start, center, end):
-        super(CircleArc, self).__init__()
+    __slots__ = ("start", "center", "end")
+
+    def __init__(self, start, center, end, id0=None):
+        super(CircleArc, self).__init__(id0=id0)
 
         assert isinstance(start, Point)
         assert isinstance(center, Point)
@@ -28,13 +32,15 @@ class CircleArc(LineBase):
         self.start = start
         self.center = center
         self.end = end
+        return
 
-        self.code = "\n".join(
-            [
-                "{} = newl;".format(self.id),
+    @property
+    def code(self):
+        return "\n".join(
+            _new_id_code(self.id, "newl")
+            + [
                 "Circle({}) = {{{}, {}, {}}};".format(
-                    self.id, start.id, center.id, end.id
-                ),
+                    self.id, self.start.id, self.center.id, self.end.id
+                )
             ]
         )
-        return
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 #
+from ..helpers import _new_id_code
+
 from .line_base import LineBase
 
 
@@ -16,17 +18,21 @@ class CompoundLine(LineBase):
         that should be reparametrized as a single line.
     """
 
-    def __init__(self, lines):
-        super(CompoundLine, self).__init__()
+    __slots__ = ("lines",)
+
+    def __init__(self, lines, id0=None):
+        super(CompoundLine, self).__init__(id0=id0)
 
-        self.lines = lines
+        self.lines = list(lines)
+        return
 
-        self.code = "\n".join(
-            [
-                "{} = newl;".format(self.id),
+    @property
+    def code(self):
+        return "\n".join(
+            _new_id_code(self.id, "newl")
+            + [
                 "Compound Line({}) = {{{}}};".format(
                     self.id, ",".join([l.id for l in self.lines])
-                ),
+                )
             ]
         )
-        return
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 #
+from ..helpers import _new_id_code
+
 from .surface_base import SurfaceBase
 
 
@@ -18,18 +20,22 @@ class CompoundSurface(SurfaceBase):
         that should be reparametrized as a single surface.
     """
 
-    def __init__(self, surfaces):
-        super(CompoundSurface, self).__init__()
+    __slots__ = ("surfaces",)
+
+    def __init__(self, surfaces, id0=None):
+        super(CompoundSurface, self).__init__(id0=id0)
         self.num_edges = sum(s.num_edges for s in surfaces)
 
-        self.surfaces = surfaces
+        self.surfaces = list(surfaces)
+        return
 
-        self.code = "\n".join(
-            [
-                "{} = news;".format(self.id),
+    @property
+    def code(self):
+        return "\n".join(
+            _new_id_code(self.id, "news")
+            + [
                 "Compound Surface({}) = {{{}}};".format(
-                    self.id, ",".join([s.id for s in surfaces])
-                ),
+                    self.id, ",".join([s.id for s in self.surfaces])
+                )
             ]
         )
-        return
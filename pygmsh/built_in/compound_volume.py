@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 #
+from ..helpers import _new_id_code
 
 
 class CompoundVolume(object):
@@ -15,20 +16,28 @@ class CompoundVolume(object):
         volumes that should be reparametrized as a single volume.
     """
 
+    __slots__ = ("volumes", "id")
+
     _ID = 0
+    dimension = 3
 
-    def __init__(self, volumes):
-        self.volumes = volumes
+    def __init__(self, volumes, id0=None):
+        self.volumes = list(volumes)
 
-        self.id = "cv{}".format(CompoundVolume._ID)
-        CompoundVolume._ID += 1
+        if id0:
+            self.id = id0
+        else:
+            self.id = "cv{}".format(CompoundVolume._ID)
+            CompoundVolume._ID += 1
+        return
 
-        self.code = "\n".join(
-            [
-                "{} = newv;".format(self.id),
+    @property
+    def code(self):
+        return "\n".join(
+            _new_id_code(self.id, "newv")
+            + [
                 "Compound Volume({}) = {{{}}};".format(
-                    self.id, ",".join([v.id for v in volumes])
-                ),
+                    self.id, ",".join([v.id for v in self.volumes])
+                )
             ]
         )
-        return
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 #
+from ..helpers import _new_id_code
+
 from .line_base import LineBase
 from .point import Point
 
@@ -20,8 +22,10 @@ class EllipseArc(LineBase):
         Coordinates of end point needed to construct circle arc.
     """
 
-    def __init__(self, start, center, point_on_major_axis, end):
-        super(EllipseArc, self).__init__()
+    __slots__ = ("start", "center", "point_on_major_axis", "end")
+
+    def __init__(self, start, center, point_on_major_axis, end, id0=None):
+        super(EllipseArc, self).__init__(id0=id0)
 
         assert isinstance(start, Point)
         assert isinstance(center, Point)
@@ -32,13 +36,19 @@ class EllipseArc(LineBase):
         self.center = center
         self.point_on_major_axis = point_on_major_axis
         self.end = end
+        return
 
-        self.code = "\n".join(
-            [
-                "{} = newl;".format(self.id),
+    @property
+    def code(self):
+        return "\n".join(
+            _new_id_code(self.id, "newl")
+            + [
                 "Ellipse({}) = {{{}, {}, {}, {}}};".format(
-                    self.id, start.id, center.id, point_on_major_axis.id, end.id
-                ),
+                    self.id,
+                    self.start.id,
+                    self.center.id,
+                    self.point_on_major_axis.id,
+                    self.end.id,
+                )
             ]
         )
-        return
@@ -1,5 +1,8 @@
 # -*- coding: utf-8 -*-
 #
+import itertools
+import math
+import re
 
 import numpy
 
@@ -16,8 +19,10 @@ from .ellipse_arc import EllipseArc
 from .line import Line
 from .line_base import LineBase
 from .line_loop import LineLoop
+from .parameter import Expression, _has_expression
 from .plane_surface import PlaneSurface
 from .point import Point
+from .point_set import PointSet
 from .spline import Spline
 from .surface import Surface
 from .surface_base import SurfaceBase
@@ -25,24 +30,122 @@ from .surface_loop import SurfaceLoop
 from .volume import Volume
 from .volume_base import VolumeBase
 
+_PHYSICAL_DIMS = {"Point": 0, "Line": 1, "Surface": 2, "Volume": 3}
+# prefixes of the variable names of the entities of each kind
+_ID_PREFIXES = {
+    "point": "p",
+    "line": "l",
+    "line_loop": "ll",
+    "surface": "s",
+    "surface_loop": "sl",
+    "volume": "vol",
+}
+
 
 class Geometry(object):
-    def __init__(self, gmsh_major_version=3):
+    """Builds Gmsh code for a geometry.
+
+    By default, every entity is a Gmsh variable that gets its tag from
+    `newp`, `newl`, etc. With `integer_tags`, the Geometry allocates the tags
+    itself and writes them literally, e.g., `Point(12) = {...};`, which is
+    faster to parse for large geometries. Entities created implicitly by Gmsh
+    (extrusions, raw code) take tags the Geometry doesn't know about, so it
+    falls back to variables afterwards.
+
+    With a `point_tolerance`, `add_point` returns the existing point if there
+    is one within that distance, so that builders like `add_polygon` share
+    the vertices of adjacent shapes and the mesh is conforming without
+    Gmsh's `Coherence`. The points are found with a spatial hash with cells
+    of size `point_tolerance`.
+    """
+
+    def __init__(self, gmsh_major_version=3, integer_tags=False, point_tolerance=None):
         self._EXTRUDE_ID = 0
         self._BOOLEAN_ID = 0
         self._ARRAY_ID = 0
         self._FIELD_ID = 0
         self._GMSH_MAJOR = gmsh_major_version
         self._TAKEN_PHYSICALGROUP_IDS = []
+        # (dimension, label, code) of all physical groups
+        self._PHYSICAL_GROUPS = []
         self._GMSH_CODE = [
             "// This code was created by pygmsh v{}.".format(__version__)
         ]
+        # highest dimension of all entities; the default meshing dimension
+        self.dimension = 0
+        self._INTEGER_TAGS = integer_tags
+        # Entity ids are counted per Geometry, so identical geometries have
+        # identical code, also if they're built concurrently.
+        self._IDS = {kind: itertools.count() for kind in _ID_PREFIXES}
+        # last integer tag in each of Gmsh's tag ranges
+        self._TAGS = {
+            "point": 0,
+            "line": 0,
+            "line_loop": 0,
+            "surface": 0,
+            "surface_loop": 0,
+            "volume": 0,
+        }
+        assert point_tolerance is None or point_tolerance > 0
+        self._POINT_TOLERANCE = point_tolerance
+        # spatial hash: grid cell -> points in that cell
+        self._POINT_INDEX = None if point_tolerance is None else {}
+        # (start point id, end point id) -> straight line
+        self._LINES = {}
         return
 
     def get_code(self):
         """Returns properly formatted Gmsh code.
         """
-        return "\n".join(self._GMSH_CODE)
+        return "\n".join(self._iter_code())
+
+    def write_code(self, fileobj, chunk_size=1000):
+        """Writes the code of :meth:`get_code` to `fileobj`, `chunk_size`
+        entities at a time, without assembling the whole string.
+        """
+        assert chunk_size > 0
+        code = self._iter_code()
+        separator = ""
+        while True:
+            chunk = list(itertools.islice(code, chunk_size))
+            if not chunk:
+                break
+            fileobj.write(separator + "\n".join(chunk))
+            separator = "\n"
+        return
+
+    def _iter_code(self):
+        return self._render(self._GMSH_CODE)
+
+    @staticmethod
+    def _render(items):
+        # The code list holds raw strings and entity objects; the latter are
+        # rendered only now.
+        for item in items:
+            yield item if _is_string(item) else item.code
+
+    def _append(self, entity):
+        self._GMSH_CODE.append(entity)
+        self._raise_dimension(entity.dimension)
+        return
+
+    def _raise_dimension(self, dim):
+        self.dimension = max(self.dimension, dim)
+        return
+
+    def _new_tag(self, kind, count=1):
+        """Returns the id of a new entity of the given kind: the next integer
+        tag as a string (`count` tags are reserved), or a new variable name.
+        """
+        if not self._INTEGER_TAGS:
+            return "{}{}".format(_ID_PREFIXES[kind], next(self._IDS[kind]))
+        self._TAGS[kind] += count
+        return str(self._TAGS[kind] - count + 1)
+
+    def _disable_integer_tags(self):
+        # Gmsh has created entities with tags of its own choosing.
+        self._INTEGER_TAGS = False
+        return
 
     # All of the add_* method below could be replaced by
     #
@@ -63,73 +166,134 @@ class Geometry(object):
     # in which case the circle code never gets added to geom.
 
     def add_bspline(self, *args, **kwargs):
-        p = Bspline(*args, **kwargs)
-        self._GMSH_CODE.append(p.code)
+        p = Bspline(*args, id0=self._new_tag("line"), **kwargs)
+        self._append(p)
         return p
 
     def add_circle_arc(self, *args, **kwargs):
-        p = CircleArc(*args, **kwargs)
-        self._GMSH_CODE.append(p.code)
+        p = CircleArc(*args, id0=self._new_tag("line"), **kwargs)
+        self._append(p)
         return p
 
     def add_compound_line(self, *args, **kwargs):
-        e = CompoundLine(*args, **kwargs)
-        self._GMSH_CODE.append(e.code)
+        e = CompoundLine(*args, id0=self._new_tag("line"), **kwargs)
+        self._append(e)
         return e
 
     def add_compound_surface(self, *args, **kwargs):
-        e = CompoundSurface(*args, **kwargs)
-        self._GMSH_CODE.append(e.code)
+        e = CompoundSurface(*args, id0=self._new_tag("surface"), **kwargs)
+        self._append(e)
         return e
 
     def add_compound_volume(self, *args, **kwargs):
-        e = CompoundVolume(*args, **kwargs)
-        self._GMSH_CODE.append(e.code)
+        e = CompoundVolume(*args, id0=self._new_tag("volume"), **kwargs)
+        self._append(e)
         return e
 
     def add_ellipse_arc(self, *args, **kwargs):
-        p = EllipseArc(*args, **kwargs)
-        self._GMSH_CODE.append(p.code)
+        p = EllipseArc(*args, id0=self._new_tag("line"), **kwargs)
+        self._append(p)
         return p
 
-    def add_line(self, *args, **kwargs):
-        p = Line(*args, **kwargs)
-        self._GMSH_CODE.append(p.code)
-        return p
+    def add_line(self, p0, p1):
+        """Adds the straight line from `p0` to `p1`. If there already is one
+        between the two points, it is returned instead, negated if it runs
+        from `p1` to `p0`. This way, adjacent shapes share their edges.
+        """
+        line = self._LINES.get((p0.id, p1.id))
+        if line is not None:
+            return line
+        line = self._LINES.get((p1.id, p0.id))
+        if line is not None:
+            return -line
+        line = Line(p0, p1, id0=self._new_tag("line"))
+        self._append(line)
+        self._LINES[(p0.id, p1.id)] = line
+        return line
 
     def add_line_loop(self, *args, **kwargs):
-        p = LineLoop(*args, **kwargs)
-        self._GMSH_CODE.append(p.code)
+        p = LineLoop(*args, id0=self._new_tag("line_loop"), **kwargs)
+        self._append(p)
         return p
 
     def add_plane_surface(self, *args, **kwargs):
-        p = PlaneSurface(*args, **kwargs)
-        self._GMSH_CODE.append(p.code)
+        p = PlaneSurface(*args, id0=self._new_tag("surface"), **kwargs)
+        self._append(p)
         return p
 
-    def add_point(self, *args, **kwargs):
-        p = Point(*args, **kwargs)
-        self._GMSH_CODE.append(p.code)
+    def add_point(self, x, lcar=None):
+        # Points at parametric positions can't be compared.
+        use_index = self._POINT_INDEX is not None and not _has_expression(x)
+        if use_index:
+            p = self._find_point(x)
+            if p is not None:
+                return p
+        p = Point(x, lcar=lcar, id0=self._new_tag("point"))
+        self._append(p)
+        if use_index:
+            self._index_point(p)
         return p
 
+    def add_points(self, X, lcar=None):
+        """Adds the points `X`, an array of shape `(n, 3)`, at once. `lcar` is
+        either one value for all points or one per point. Returns a
+        :class:`PointSet` that can be indexed like a list of points.
+
+        All points are created, even with a `point_tolerance`; later calls of
+        `add_point` reuse them, though.
+        """
+        p = PointSet(X, lcar=lcar, id0=self._new_tag("point", len(X)))
+        self._append(p)
+        if self._POINT_INDEX is not None:
+            for k in range(len(p)):
+                if not _has_expression(p.x[k]):
+                    self._index_point(p[k])
+        return p
+
+    def _point_cell(self, x):
+        return tuple(int(math.floor(c / self._POINT_TOLERANCE)) for c in x[:3])
+
+    def _index_point(self, p):
+        self._POINT_INDEX.setdefault(self._point_cell(p.x), []).append(p)
+        return
+
+    def _find_point(self, x):
+        """Returns a point within `point_tolerance` of `x`, or `None`.
+        """
+        tol2 = self._POINT_TOLERANCE ** 2
+        x = [float(c) for c in x[:3]]
+        cell = self._point_cell(x)
+        # A point within the tolerance is in the same or a neighboring cell.
+        for offset in itertools.product([-1, 0, 1], repeat=3):
+            key = (cell[0] + offset[0], cell[1] + offset[1], cell[2] + offset[2])
+            for p in self._POINT_INDEX.get(key, []):
+                if sum((float(a) - b) ** 2 for a, b in zip(p.x, x)) <= tol2:
+                    return p
+        return None
+
     def add_spline(self, *args, **kwargs):
-        p = Spline(*args, **kwargs)
-        self._GMSH_CODE.append(p.code)
+        p = Spline(*args, id0=self._new_tag("line"), **kwargs)
+        self._append(p)
         return p
 
     def add_surface(self, *args, **kwargs):
-        s = Surface(*args, api_level=self._GMSH_MAJOR, **kwargs)
-        self._GMSH_CODE.append(s.code)
+        s = Surface(
+            *args,
+            api_level=self._GMSH_MAJOR,
+            id0=self._new_tag("surface"),
+            **kwargs
+        )
+        self._append(s)
         return s
 
     def add_surface_loop(self, *args, **kwargs):
-        e = SurfaceLoop(*args, **kwargs)
-        self._GMSH_CODE.append(e.code)
+        e = SurfaceLoop(*args, id0=self._new_tag("surface_loop"), **kwargs)
+        self._append(e)
         return e
 
     def add_volume(self, *args, **kwargs):
-        e = Volume(*args, **kwargs)
-        self._GMSH_CODE.append(e.code)
+        e = Volume(*args, id0=self._new_tag("volume"), **kwargs)
+        self._append(e)
         return e
 
     def _new_physical_group(self, label=None):
@@ -158,13 +322,57 @@ class Geometry(object):
         label = self._new_physical_group(label)
         if not isinstance(entities, list):
             entities = [entities]
-        self._GMSH_CODE.append(
-            "Physical {}({}) = {{{}}};".format(
-                tpe, label, ", ".join([e.id for e in entities])
-            )
+        code = "Physical {}({}) = {{{}}};".format(
+            tpe, label, ", ".join([e.id for e in entities])
         )
+        self._GMSH_CODE.append(code)
+        self._PHYSICAL_GROUPS.append((_PHYSICAL_DIMS[tpe], label, code))
         return
 
+    def _get_physical_selection_code(self, labels=None, dims=None):
+        """Returns Gmsh code that replaces the physical groups by those with the
+        given labels and dimensions. Since Gmsh only saves elements that belong
+        to a physical group, this restricts the mesh output. If the geometry
+        has no physical groups, one group is created for all entities of each
+        dimension in `dims`. Physical groups from raw code are dropped.
+
+        A `ValueError` is raised if no physical group is selected; Gmsh would
+        save all elements then.
+        """
+        lines = ["Delete Physicals;", "Mesh.SaveAll = 0;"]
+        if self._PHYSICAL_GROUPS:
+            if labels is not None:
+                labels = set(
+                    '"{}"'.format(label) if _is_string(label) else str(label)
+                    for label in labels
+                )
+                unknown = labels - set(label for _, label, _ in self._PHYSICAL_GROUPS)
+                assert not unknown, "Unknown physical groups {}.".format(
+                    ", ".join(sorted(unknown))
+                )
+            for dim, label, code in self._PHYSICAL_GROUPS:
+                if labels is not None and label not in labels:
+                    continue
+                if dims is not None and dim not in dims:
+                    continue
+                lines.append(code)
+        else:
+            assert labels is None, "The geometry has no physical groups."
+            assert dims is not None
+            names = {v: k for k, v in _PHYSICAL_DIMS.items()}
+            for k, dim in enumerate(sorted(dims)):
+                lines.append(
+                    "Physical {0}({1}) = {{{0}{{:}}}};".format(names[dim], k + 1)
+                )
+        if len(lines) == 2:
+            raise ValueError(
+                "No physical group matches labels {} and dimensions {}.".format(
+                    None if labels is None else sorted(labels),
+                    None if dims is None else sorted(dims),
+                )
+            )
+        return "\n".join(lines)
+
     def add_physical_point(self, points, label=None):
         self._add_physical("Point", points, label=label)
         return
@@ -235,7 +443,11 @@ class Geometry(object):
 
         # Define points that make the circle (midpoint and the four cardinal
         # directions).
-        X = numpy.zeros((num_sections + 1, len(x0)))
+        # Parameters need an array of objects.
+        dtype = object if _has_expression(x0) else float
+        if isinstance(radius, Expression):
+            dtype = object
+        X = numpy.zeros((num_sections + 1, len(x0)), dtype=dtype)
         if num_sections == 4:
             # For accuracy, the points are provided explicitly.
             X[1:, [0, 1]] = numpy.array(
@@ -342,6 +554,7 @@ class Geometry(object):
 
         # out[] = Extrude{0,1,0}{ Line{1}; };
         name = "ex{}".format(self._EXTRUDE_ID)
+        self._disable_integer_tags()
         if translation_axis is not None:
             if rotation_axis is not None:
                 extrusion_string = "{}[] = Extrude{{{{{}}}, {{{}}}, {{{}}}, {}}}{{{};".format(
@@ -394,12 +607,15 @@ class Geometry(object):
             top = LineBase(top)
             # A surface extruded from a single line has always 4 edges
             extruded = SurfaceBase(extruded, 4)
+            self._raise_dimension(2)
         elif isinstance(input_entity, SurfaceBase):
             top = SurfaceBase(top, input_entity.num_edges)
             extruded = VolumeBase(extruded)
+            self._raise_dimension(3)
         else:
             top = Dummy(top)
             extruded = Dummy(extruded)
+            self._raise_dimension(3)
 
         lat = []
         # lateral surfaces can be deduced only if we start from a SurfaceBase
@@ -486,9 +702,29 @@ class Geometry(object):
         self._GMSH_CODE.append("// " + string)
         return
 
+    def parameter(self, name, value):
+        """Defines the Gmsh parameter `name` with the default `value` via
+        `DefineConstant` and returns it as an :class:`Expression` that can be
+        used instead of a number in `add_point`, `add_circle`, as `lcar`, etc.
+
+        The code needs to be generated only once; the parameter is set when
+        meshing, e.g., with the `parameters` argument of
+        :func:`pygmsh.generate_mesh` (Gmsh's `-setnumber`).
+        """
+        assert re.match(r"^[A-Za-z_]\w*$", name), "Illegal name '{}'.".format(name)
+        self._GMSH_CODE.append(
+            'DefineConstant[ {} = {{{!r}, Name "Parameters/{}"}} ];'.format(
+                name, float(value), name
+            )
+        )
+        return Expression(name)
+
     def add_raw_code(self, string_or_list):
-        """Add raw Gmsh code.
+        """Add raw Gmsh code. Since pygmsh can't tell which entities the code
+        creates, the dimension of the geometry is set to 3.
         """
+        self._raise_dimension(3)
+        self._disable_integer_tags()
         if _is_string(string_or_list):
             self._GMSH_CODE.append(string_or_list)
         else:
@@ -520,8 +756,16 @@ class Geometry(object):
         else:
             assert make_surface
 
-        # Create points.
-        p = [self.add_point(x, lcar=lcar) for x in X]
+        # Create points. Let add_point find shared vertices if requested.
+        if self._POINT_INDEX is not None:
+            if numpy.ndim(lcar) == 0:
+                lcars = [lcar] * len(X)
+            else:
+                lcars = list(lcar)
+                assert len(lcars) == len(X), "Need one lcar per point."
+            p = [self.add_point(x, lcar=lc) for x, lc in zip(X, lcars)]
+        else:
+            p = self.add_points(X, lcar=lcar)
         # Create lines
         lines = [self.add_line(p[k], p[k + 1]) for k in range(len(p) - 1)]
         lines.append(self.add_line(p[-1], p[0]))
@@ -720,7 +964,7 @@ class Geometry(object):
         # the entity that has been extruded at the far end. This can be used
         # for the following Extrude() step.  The second [1] entry of the array
         # is the surface that was created by the extrusion.
-        previous = c.line_loop.lines
+        previous = list(c.line_loop.lines)
         angle = "2*Pi/3"
         all_surfaces = []
         for i in range(3):
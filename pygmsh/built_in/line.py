@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 #
+from ..helpers import _new_id_code
+
 from .line_base import LineBase
 from .point import Point
 
@@ -21,17 +23,23 @@ class Line(LineBase):
         List containing the begin and end points of the line.
     """
 
-    def __init__(self, p0, p1):
-        super(Line, self).__init__()
+    __slots__ = ("points",)
+
+    def __init__(self, p0, p1, id0=None):
+        super(Line, self).__init__(id0=id0)
 
         assert isinstance(p0, Point)
         assert isinstance(p1, Point)
         self.points = [p0, p1]
+        return
 
-        self.code = "\n".join(
-            [
-                "{} = newl;".format(self.id),
-                "Line({}) = {{{}, {}}};".format(self.id, p0.id, p1.id),
+    @property
+    def code(self):
+        return "\n".join(
+            _new_id_code(self.id, "newl")
+            + [
+                "Line({}) = {{{}, {}}};".format(
+                    self.id, self.points[0].id, self.points[1].id
+                )
             ]
         )
-        return
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 #
-import copy
 
 
 class LineBase(object):
@@ -14,6 +13,8 @@ class LineBase(object):
         If no unique ID is given, the object global is incremented.
     """
 
+    __slots__ = ("id",)
+
     _ID = 0
     dimension = 1
 
@@ -26,6 +27,28 @@ class LineBase(object):
         return
 
     def __neg__(self):
-        neg_self = copy.deepcopy(self)
-        neg_self.id = "-" + neg_self.id
-        return neg_self
+        return _ReversedLine(self)
+
+
+class _ReversedLine(LineBase):
+    """
+    The line `line` with the opposite orientation. Shares everything but the
+    id with `line`, so reversing costs the same for all lines.
+    """
+
+    __slots__ = ("line",)
+
+    def __init__(self, line):
+        # no new id
+        self.line = line
+        self.id = "-" + line.id
+        return
+
+    def __neg__(self):
+        return self.line
+
+    def __getattr__(self, name):
+        # only called for attributes not found on the view itself
+        if name == "line":
+            raise AttributeError(name)
+        return getattr(self.line, name)
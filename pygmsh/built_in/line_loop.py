@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 #
+from ..helpers import _new_id_code
 
 
 class LineLoop(object):
@@ -24,24 +25,31 @@ class LineLoop(object):
     reorder the list internally to create a consistent loop.
     """
 
+    __slots__ = ("lines", "id")
+
     _ID = 0
     dimension = 1
 
-    def __init__(self, lines):
-        self.lines = lines
+    def __init__(self, lines, id0=None):
+        self.lines = list(lines)
 
-        self.id = "ll{}".format(LineLoop._ID)
-        LineLoop._ID += 1
+        if id0:
+            self.id = id0
+        else:
+            self.id = "ll{}".format(LineLoop._ID)
+            LineLoop._ID += 1
+        return
 
-        self.code = "\n".join(
-            [
-                "{} = newll;".format(self.id),
+    @property
+    def code(self):
+        return "\n".join(
+            _new_id_code(self.id, "newll")
+            + [
                 "Line Loop({}) = {{{}}};".format(
-                    self.id, ", ".join([l.id for l in lines])
-                ),
+                    self.id, ", ".join([l.id for l in self.lines])
+                )
             ]
         )
-        return
 
     def __len__(self):
         return len(self.lines)
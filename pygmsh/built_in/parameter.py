@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+#
+import numbers
+
+import numpy
+
+
+class Expression(object):
+    """
+    A Gmsh expression, e.g., a parameter defined with `Geometry.parameter`.
+
+    Expressions can be combined with numbers and other expressions by the
+    arithmetic operators and by NumPy's `cos`, `sin`, etc. (on arrays of
+    dtype `object`). They can be used instead of numbers for coordinates,
+    radii, mesh sizes etc. and end up in the Gmsh code as they are.
+
+    Parameters
+    ----------
+    expr : str
+        The expression in Gmsh's syntax.
+    """
+
+    __slots__ = ("expr",)
+
+    def __init__(self, expr):
+        self.expr = expr
+        return
+
+    def __str__(self):
+        return self.expr
+
+    # for code that is formatted with `{!r}`
+    __repr__ = __str__
+
+    def __add__(self, other):
+        if _is_number(other) and other == 0:
+            return self
+        return _binary(self, "+", other)
+
+    def __radd__(self, other):
+        if _is_number(other) and other == 0:
+            return self
+        return _binary(other, "+", self)
+
+    def __sub__(self, other):
+        if _is_number(other) and other == 0:
+            return self
+        return _binary(self, "-", other)
+
+    def __rsub__(self, other):
+        return _binary(other, "-", self)
+
+    def __mul__(self, other):
+        if _is_number(other):
+            if other == 0:
+                return 0.0
+            if other == 1:
+                return self
+        return _binary(self, "*", other)
+
+    def __rmul__(self, other):
+        if _is_number(other):
+            if other == 0:
+                return 0.0
+            if other == 1:
+                return self
+        return _binary(other, "*", self)
+
+    def __truediv__(self, other):
+        return _binary(self, "/", other)
+
+    def __rtruediv__(self, other):
+        return _binary(other, "/", self)
+
+    # Python 2
+    __div__ = __truediv__
+    __rdiv__ = __rtruediv__
+
+    def __pow__(self, other):
+        return _binary(self, "^", other)
+
+    def __rpow__(self, other):
+        return _binary(other, "^", self)
+
+    def __neg__(self):
+        return Expression("(-{})".format(self))
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return Expression("Fabs({})".format(self))
+
+    # called by NumPy's ufuncs on arrays of dtype object
+    def cos(self):
+        return Expression("Cos({})".format(self))
+
+    def sin(self):
+        return Expression("Sin({})".format(self))
+
+    def tan(self):
+        return Expression("Tan({})".format(self))
+
+    def sqrt(self):
+        return Expression("Sqrt({})".format(self))
+
+    def exp(self):
+        return Expression("Exp({})".format(self))
+
+    def log(self):
+        return Expression("Log({})".format(self))
+
+
+def _is_number(value):
+    return isinstance(value, numbers.Number)
+
+
+def _binary(a, op, b):
+    return Expression("({} {} {})".format(_format(a), op, _format(b)))
+
+
+def _format(value):
+    """Formats a number or an expression for the Gmsh code.
+    """
+    return repr(_as_number(value))
+
+
+def _as_number(value):
+    """Returns `value` as a float unless it's an :class:`Expression`.
+    """
+    return value if isinstance(value, Expression) else float(value)
+
+
+def _as_number_array(a):
+    """Returns a copy of `a` as a float array or, if it contains
+    :class:`Expression`s, as an object array of floats and expressions.
+    """
+    try:
+        return numpy.array(a, dtype=float)
+    except TypeError:
+        return numpy.vectorize(_as_number, otypes=[object])(
+            numpy.array(a, dtype=object)
+        )
+
+
+def _has_expression(values):
+    return any(isinstance(value, Expression) for value in values)
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 #
+from ..helpers import _new_id_code
+
 from .surface_base import SurfaceBase
 from .line_loop import LineLoop
 
@@ -30,8 +32,10 @@ class PlaneSurface(SurfaceBase):
     surface (in which case the two line loops should be combined).
     """
 
-    def __init__(self, line_loop, holes=None):
-        super(PlaneSurface, self).__init__()
+    __slots__ = ("line_loop", "holes")
+
+    def __init__(self, line_loop, holes=None, id0=None):
+        super(PlaneSurface, self).__init__(id0=id0)
 
         assert isinstance(line_loop, LineLoop)
         self.line_loop = line_loop
@@ -43,14 +47,16 @@ class PlaneSurface(SurfaceBase):
         # loops (like polygons).
         self.holes = [h if isinstance(h, LineLoop) else h.line_loop for h in holes]
 
-        line_loops = [self.line_loop] + self.holes
-        self.code = "\n".join(
-            [
-                "{} = news;".format(self.id),
+        self.num_edges = len(self.line_loop) + sum(len(h) for h in self.holes)
+        return
+
+    @property
+    def code(self):
+        return "\n".join(
+            _new_id_code(self.id, "news")
+            + [
                 "Plane Surface({}) = {{{}}};".format(
-                    self.id, ",".join([ll.id for ll in line_loops])
-                ),
+                    self.id, ",".join([ll.id for ll in [self.line_loop] + self.holes])
+                )
             ]
         )
-        self.num_edges = len(self.line_loop) + sum(len(h) for h in self.holes)
-        return
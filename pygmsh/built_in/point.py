@@ -1,5 +1,10 @@
 # -*- coding: utf-8 -*-
 #
+import numpy
+
+from ..helpers import _new_id_code
+
+from .parameter import _as_number
 
 
 class Point(object):
@@ -13,32 +18,36 @@ class Point(object):
         The prescribed mesh element size at this point.
     """
 
+    __slots__ = ("x", "lcar", "id")
+
     _POINT_ID = 0
+    dimension = 0
 
-    def __init__(self, x, lcar=None):
-        self.x = x
-        self.lcar = lcar
-
-        self.id = "p{}".format(Point._POINT_ID)
-        Point._POINT_ID += 1
-
-        # Points are always 3D in gmsh
-        if lcar is not None:
-            self.code = "\n".join(
-                [
-                    "{} = newp;".format(self.id),
-                    "Point({}) = {{{!r}, {!r}, {!r}, {!r}}};".format(
-                        self.id, x[0], x[1], x[2], lcar
-                    ),
-                ]
-            )
+    def __init__(self, x, lcar=None, id0=None):
+        # Copies; the code is only rendered later, and the caller may reuse its
+        # array for the next point.
+        self.x = numpy.array(x)
+        self.lcar = None if lcar is None else _as_number(lcar)
+
+        if id0:
+            self.id = id0
         else:
-            self.code = "\n".join(
-                [
-                    "{} = newp;".format(self.id),
-                    "Point({}) = {{{!r}, {!r}, {!r}}};".format(
-                        self.id, x[0], x[1], x[2]
-                    ),
-                ]
-            )
+            self.id = "p{}".format(Point._POINT_ID)
+            Point._POINT_ID += 1
         return
+
+    @property
+    def code(self):
+        # Points are always 3D in gmsh. Plain floats are formatted; the repr
+        # of NumPy scalars isn't a number in NumPy 2.
+        values = [_as_number(self.x[0]), _as_number(self.x[1]), _as_number(self.x[2])]
+        if self.lcar is not None:
+            values.append(_as_number(self.lcar))
+        return "\n".join(
+            _new_id_code(self.id, "newp")
+            + [
+                "Point({}) = {{{}}};".format(
+                    self.id, ", ".join(repr(v) for v in values)
+                )
+            ]
+        )
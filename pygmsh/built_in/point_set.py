@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+#
+import itertools
+
+import numpy
+
+from ..helpers import _new_id_code
+
+from .parameter import _as_number_array
+from .point import Point
+
+
+class PointSet(object):
+    """
+    Creates many elementary points at once. The coordinates are kept in one
+    array, and the code of all points is formatted in one pass.
+
+    Parameters
+    ----------
+    X : array-like[n][3]
+        Coordinates of the points; numbers or :class:`Expression`s.
+    lcar : float or array-like[n]
+        The prescribed mesh element size at the points.
+
+    Notes
+    -----
+    The points are tagged `id+0`, ..., `id+(n-1)` (or, with an integer `id`,
+    `id`, ..., `id+n-1`). Indexing the set returns a :class:`Point` with the
+    tag of the respective point which can be passed to `add_line`,
+    `add_spline` etc.; it isn't added to the geometry again. These points are
+    created on first access only and merely refer to the set.
+    """
+
+    __slots__ = ("x", "lcar", "id", "_points")
+
+    _ID = 0
+    dimension = 0
+
+    def __init__(self, X, lcar=None, id0=None):
+        # copies, see Point
+        X = _as_number_array(X)
+        assert X.ndim == 2 and X.shape[1] == 3
+        assert len(X) > 0
+        self.x = X
+
+        if lcar is not None:
+            lcar = numpy.broadcast_to(_as_number_array(lcar), (len(X),))
+        self.lcar = lcar
+
+        if id0:
+            self.id = id0
+        else:
+            self.id = "ps{}".format(PointSet._ID)
+            PointSet._ID += 1
+
+        # the points handed out so far, by index
+        self._points = {}
+        return
+
+    def __len__(self):
+        return len(self.x)
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            return [self[i] for i in range(*k.indices(len(self)))]
+        k = range(len(self))[k]
+        p = self._points.get(k)
+        if p is None:
+            p = self._points[k] = _PointSetPoint(self, k, self._id(k))
+        return p
+
+    def _id(self, k):
+        if self.id.isdigit():
+            return str(int(self.id) + k)
+        return "{}+{}".format(self.id, k)
+
+    @property
+    def code(self):
+        n = len(self)
+        if self.id.isdigit():
+            tags = range(int(self.id), int(self.id) + n)
+            fmt = "Point(%d) = {%r, %r, %r"
+        else:
+            tags = range(n)
+            fmt = "Point(" + self.id + "+%d) = {%r, %r, %r"
+        # Python floats (or expressions), formatted by repr
+        columns = [tags] + self.x.T.tolist()
+        if self.lcar is not None:
+            columns.append(self.lcar.tolist())
+            fmt += ", %r"
+        fmt += "};"
+        values = tuple(itertools.chain.from_iterable(zip(*columns)))
+        return "\n".join(
+            _new_id_code(self.id, "newp") + ["\n".join([fmt] * n) % values]
+        )
+
+
+class _PointSetPoint(Point):
+    """The point `k` of a :class:`PointSet`. It only refers to the set; the
+    coordinates aren't copied.
+    """
+
+    __slots__ = ("_point_set", "_k")
+
+    def __init__(self, point_set, k, id0):
+        self._point_set = point_set
+        self._k = k
+        self.id = id0
+        return
+
+    @property
+    def x(self):
+        return self._point_set.x[self._k]
+
+    @property
+    def lcar(self):
+        lcar = self._point_set.lcar
+        return None if lcar is None else lcar[self._k]
+
+    def __reduce__(self):
+        # The properties can't be restored like slots.
+        return (_PointSetPoint, (self._point_set, self._k, self.id))
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 #
+from ..helpers import _new_id_code
+
 from .line_base import LineBase
 from .point import Point
 
@@ -14,21 +16,25 @@ class Spline(LineBase):
         List containing Point objects
     """
 
-    def __init__(self, points):
-        super(Spline, self).__init__()
+    __slots__ = ("points",)
+
+    def __init__(self, points, id0=None):
+        super(Spline, self).__init__(id0=id0)
 
         for c in points:
             assert isinstance(c, Point)
         assert len(points) > 1
 
-        self.points = points
+        self.points = list(points)
+        return
 
-        self.code = "\n".join(
-            [
-                "{} = newl;".format(self.id),
+    @property
+    def code(self):
+        return "\n".join(
+            _new_id_code(self.id, "newl")
+            + [
                 "Spline({}) = {{{}}};".format(
                     self.id, ", ".join([c.id for c in self.points])
-                ),
+                )
             ]
         )
-        return
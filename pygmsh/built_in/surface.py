@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 #
+from ..helpers import _new_id_code
+
 from .line_loop import LineLoop
 
 
@@ -26,26 +28,37 @@ class Surface(object):
     identification number of the center of the sphere).
     """
 
+    __slots__ = ("line_loop", "id", "api_level", "num_edges")
+
     _ID = 0
-    num_edges = 0
     dimension = 2
 
-    def __init__(self, line_loop, api_level=2):
+    def __init__(self, line_loop, api_level=2, id0=None):
         assert isinstance(line_loop, LineLoop)
 
         self.line_loop = line_loop
 
-        self.id = "rs{}".format(Surface._ID)
-        Surface._ID += 1
+        if id0:
+            self.id = id0
+        else:
+            self.id = "rs{}".format(Surface._ID)
+            Surface._ID += 1
 
-        # `Ruled Surface` was deprecated in Gmsh 3 in favor of `Surface`.
-        name = "Surface" if api_level > 2 else "Ruled Surface"
+        self.api_level = api_level
+        self.num_edges = len(line_loop)
+        return
 
-        self.code = "\n".join(
-            [
-                "{} = news;".format(self.id),
-                "{}({}) = {{{}}};".format(name, self.id, self.line_loop.id),
+    @property
+    def code(self):
+        return "\n".join(
+            _new_id_code(self.id, "news")
+            + [
+                "{}({}) = {{{}}};".format(
+                    # `Ruled Surface` was deprecated in Gmsh 3 in favor of
+                    # `Surface`.
+                    "Surface" if self.api_level > 2 else "Ruled Surface",
+                    self.id,
+                    self.line_loop.id,
+                )
             ]
         )
-        self.num_edges = len(line_loop)
-        return
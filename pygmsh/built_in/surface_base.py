@@ -13,8 +13,9 @@ class SurfaceBase(object):
         If no unique ID is given, the object global is incremented.
     """
 
+    __slots__ = ("id", "num_edges")
+
     _ID = 0
-    num_edges = 0
     dimension = 2
 
     def __init__(self, id0=None, num_edges=0):
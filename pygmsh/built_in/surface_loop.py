@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 #
+from ..helpers import _new_id_code
 
 
 class SurfaceLoop(object):
@@ -24,21 +25,28 @@ class SurfaceLoop(object):
     negative identification numbers to specify reverse orientation).
     """
 
+    __slots__ = ("surfaces", "id")
+
     _ID = 0
     dimension = 2
 
-    def __init__(self, surfaces):
-        self.surfaces = surfaces
+    def __init__(self, surfaces, id0=None):
+        self.surfaces = list(surfaces)
 
-        self.id = "sl{}".format(SurfaceLoop._ID)
-        SurfaceLoop._ID += 1
+        if id0:
+            self.id = id0
+        else:
+            self.id = "sl{}".format(SurfaceLoop._ID)
+            SurfaceLoop._ID += 1
+        return
 
-        self.code = "\n".join(
-            [
-                "{} = news;".format(self.id),
+    @property
+    def code(self):
+        return "\n".join(
+            _new_id_code(self.id, "news")
+            + [
                 "Surface Loop({}) = {{{}}};".format(
-                    self.id, ",".join([s.id for s in surfaces])
-                ),
+                    self.id, ",".join([s.id for s in self.surfaces])
+                )
             ]
         )
-        return
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 #
+from ..helpers import _new_id_code
 
 from .volume_base import VolumeBase
 
@@ -30,23 +31,26 @@ class Volume(VolumeBase):
     (in which case the two surface loops should be combined).
     """
 
-    def __init__(self, surface_loop, holes=None):
-        super(Volume, self).__init__()
+    __slots__ = ("surface_loop", "holes")
+
+    def __init__(self, surface_loop, holes=None, id0=None):
+        super(Volume, self).__init__(id0=id0)
 
         if holes is None:
             holes = []
 
         self.surface_loop = surface_loop
-        self.holes = holes
-
-        surface_loops = [surface_loop] + holes
+        self.holes = list(holes)
+        return
 
-        self.code = "\n".join(
-            [
-                "{} = newv;".format(self.id),
+    @property
+    def code(self):
+        return "\n".join(
+            _new_id_code(self.id, "newv")
+            + [
                 "Volume({}) = {{{}}};".format(
-                    self.id, ", ".join([s.id for s in surface_loops])
-                ),
+                    self.id,
+                    ", ".join([s.id for s in [self.surface_loop] + self.holes]),
+                )
             ]
         )
-        return
@@ -13,6 +13,8 @@ class VolumeBase(object):
         If no unique ID is given, the object global is incremented.
     """
 
+    __slots__ = ("id",)
+
     _ID = 0
     dimension = 3
 
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+#
+import hashlib
+import json
+import os
+import tempfile
+
+import numpy
+import meshio
+
+
+class MeshCache(object):
+    """Content-addressed on-disk cache for the meshes produced by Gmsh.
+
+    Entries are keyed on a hash of the Gmsh code, the meshing dimension, the
+    Gmsh arguments, the output file type, and the Gmsh version. Each entry is a
+    single uncompressed `.npz` file holding the raw arrays plus a JSON
+    manifest. Entries are written atomically (write to a temporary file, then
+    rename), so several processes can share one cache directory.
+
+    When the total size of the cache exceeds `max_bytes`, the least recently
+    used entries are evicted.
+
+    :param directory: cache directory; created if it doesn't exist.
+    :param max_bytes: size limit of the cache in bytes.
+    """
+
+    def __init__(self, directory, max_bytes=2 ** 30):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        if not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                # Another process may have created it in the meantime.
+                assert os.path.isdir(directory)
+        return
+
+    @staticmethod
+    def key(code, dim, gmsh_arguments, gmsh_version, filetype):
+        h = hashlib.sha256()
+        for item in [code, str(dim), " ".join(gmsh_arguments), gmsh_version, filetype]:
+            h.update(item.encode("utf-8"))
+            # separator
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def _filename(self, key):
+        return os.path.join(self.directory, key + ".npz")
+
+    def load(self, key):
+        """Returns the cached meshio mesh for `key`, or `None` on a miss.
+        """
+        filename = self._filename(key)
+        try:
+            with numpy.load(filename) as data:
+                manifest = json.loads(str(data["manifest"]))
+                arrays = {name: data[name] for name in data.files}
+        except (IOError, OSError, ValueError, KeyError):
+            # missing, evicted, or corrupt
+            return None
+
+        # Mark as recently used.
+        try:
+            os.utime(filename, None)
+        except OSError:
+            pass
+
+        points = arrays[manifest["points"]]
+        cells = {}
+        point_data = {}
+        cell_data = {}
+        field_data = {}
+        for kind, path, name in manifest["arrays"]:
+            if kind == "cells":
+                cells[path[0]] = arrays[name]
+            elif kind == "point_data":
+                point_data[path[0]] = arrays[name]
+            elif kind == "cell_data":
+                cell_data.setdefault(path[0], {})[path[1]] = arrays[name]
+            else:
+                assert kind == "field_data"
+                field_data[path[0]] = arrays[name]
+
+        return meshio.Mesh(
+            points,
+            cells,
+            point_data=point_data,
+            cell_data=cell_data,
+            field_data=field_data,
+        )
+
+    def store(self, key, mesh):
+        """Stores a meshio mesh under `key`.
+        """
+        # Array names in the npz file are generic; the manifest maps them back
+        # to their place in the mesh. (Data names like `gmsh:physical` aren't
+        # necessarily valid file names.)
+        arrays = {"a0": numpy.asarray(mesh.points)}
+        entries = []
+
+        def add(kind, path, value):
+            name = "a{}".format(len(arrays))
+            arrays[name] = numpy.asarray(value)
+            entries.append([kind, path, name])
+            return
+
+        for tpe, value in mesh.cells.items():
+            add("cells", [tpe], value)
+        for name, value in mesh.point_data.items():
+            add("point_data", [name], value)
+        for tpe, data in mesh.cell_data.items():
+            for name, value in data.items():
+                add("cell_data", [tpe, name], value)
+        for name, value in mesh.field_data.items():
+            add("field_data", [name], value)
+
+        manifest = {"points": "a0", "arrays": entries}
+        arrays["manifest"] = numpy.array(json.dumps(manifest))
+
+        fd, tmp_filename = tempfile.mkstemp(
+            suffix=".npz.tmp", dir=self.directory
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                numpy.savez(f, **arrays)
+            # Atomic on POSIX; readers see either no entry or the full entry.
+            getattr(os, "replace", os.rename)(tmp_filename, self._filename(key))
+        except Exception:
+            os.remove(tmp_filename)
+            raise
+
+        self._evict()
+        return
+
+    def _evict(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".npz"):
+                continue
+            filename = os.path.join(self.directory, name)
+            try:
+                st = os.stat(filename)
+            except OSError:
+                # removed by a concurrent process
+                continue
+            entries.append((st.st_mtime, st.st_size, filename))
+
+        total = sum(size for _, size, _ in entries)
+        # oldest first
+        for _, size, filename in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(filename)
+            except OSError:
+                pass
+            total -= size
+        return
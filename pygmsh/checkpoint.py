@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+#
+import hashlib
+import os
+import re
+import tempfile
+
+from .helpers import _get_gmsh_exe, _get_gmsh_version, _run
+
+# Code that refers to entities of the model, or sets mesh sizes on them. None
+# of this survives the export; the entities of the checkpoint are numbered
+# anew. Parameters would be fixed to their defaults in the checkpoint.
+_UNSUPPORTED = re.compile(
+    r"^\s*(Physical|Characteristic Length|Field\s*\[|Background Field|"
+    r"Transfinite|Recombine|Compound|Periodic|DefineConstant|Mesh\.\w+|"
+    r".*\bLayers\s*\{)"
+)
+# Points with a characteristic length
+_POINT_LCAR = re.compile(r"^\s*Point\s*\([^)]*\)\s*=\s*\{[^,}]*,[^,}]*,[^,}]*,[^}]*\}")
+
+
+def get_checkpoint_code(geo_object, directory, log, gmsh_path=None):
+    """Returns Gmsh code that loads the model of an OpenCASCADE geometry from
+    a checkpoint and applies the geometry's global mesh size settings.
+
+    The model, i.e., the result of all boolean operations, is exported once
+    with `gmsh -0` to a `.brep` file in `directory`, named by a hash of the
+    model code and the Gmsh version. Changing `characteristic_length_min` or
+    `characteristic_length_max` of the geometry between runs reuses the
+    checkpoint.
+
+    Physical groups, per-entity mesh sizes, fields, and other code that refers
+    to entities of the model aren't carried over to the checkpoint, so such
+    geometries are refused.
+    """
+    assert hasattr(
+        geo_object, "_get_model_code"
+    ), "Only opencascade geometries can be checkpointed."
+    code = geo_object._get_model_code()
+
+    for line in code.split("\n"):
+        assert not (
+            _UNSUPPORTED.match(line) or _POINT_LCAR.match(line)
+        ), "Can't checkpoint a geometry with the code '{}'.".format(line.strip())
+
+    gmsh_executable = gmsh_path if gmsh_path is not None else _get_gmsh_exe()
+    h = hashlib.sha256()
+    for item in [code, _get_gmsh_version(gmsh_executable)]:
+        h.update(item.encode("utf-8"))
+        # separator
+        h.update(b"\0")
+    brep_filename = os.path.join(directory, h.hexdigest() + ".brep")
+
+    if not os.path.exists(brep_filename):
+        if not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                # Another process may have created it in the meantime.
+                assert os.path.isdir(directory)
+
+        fd, geo_filename = tempfile.mkstemp(suffix=".geo", dir=directory)
+        with os.fdopen(fd, "w") as f:
+            f.write(code)
+        # Gmsh has no `-format brep`; it picks the format from the extension.
+        fd, tmp_filename = tempfile.mkstemp(suffix=".brep", dir=directory)
+        os.close(fd)
+        try:
+            _run([gmsh_executable, geo_filename, "-0", "-o", tmp_filename], log)
+            # Gmsh exits with 0 even if it can't write the file.
+            if os.path.getsize(tmp_filename) == 0:
+                raise log.error(
+                    "Gmsh didn't export the model to {}.".format(tmp_filename)
+                )
+            # Atomic on POSIX; readers see either no checkpoint or all of it.
+            getattr(os, "replace", os.rename)(tmp_filename, brep_filename)
+        finally:
+            for filename in [geo_filename, tmp_filename]:
+                if os.path.exists(filename):
+                    os.remove(filename)
+
+    return "\n".join(
+        [code.split("\n")[0], 'SetFactory("OpenCASCADE");']
+        + geo_object._get_mesh_size_code()
+        + ['Merge "{}";'.format(brep_filename)]
+    )
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+#
+import numpy
+import meshio
+
+from .msh_io import _gmsh_to_meshio_ordering, _gmsh_to_meshio_type
+
+
+def has_gmsh_module():
+    """Returns `True` if the Gmsh Python module can be imported.
+    """
+    try:
+        import gmsh  # noqa F401
+    except (ImportError, OSError):
+        # OSError: The module is there, but the Gmsh library can't be loaded.
+        return False
+    return True
+
+
+def extract_mesh(gmsh):
+    """Returns the mesh of Gmsh's current model as a meshio mesh, taken
+    directly from Gmsh's node and element arrays.
+
+    Like Gmsh's msh writer, only elements which belong to a physical group are
+    extracted if any physical groups are defined (and `Mesh.SaveAll` isn't
+    set). Elements in more than one physical group appear once per group.
+    """
+    node_tags, coords, _ = gmsh.model.mesh.getNodes()
+    node_tags = numpy.asarray(node_tags, dtype=int)
+    points = numpy.asarray(coords, dtype=float).reshape(-1, 3)
+    # Node tags needn't be contiguous.
+    tag_to_index = numpy.full(node_tags.max() + 1 if len(node_tags) else 0, -1)
+    tag_to_index[node_tags] = numpy.arange(len(node_tags))
+
+    field_data = {}
+    entity_physicals = {}
+    for dim, tag in gmsh.model.getPhysicalGroups():
+        name = gmsh.model.getPhysicalName(dim, tag)
+        if name:
+            field_data[name] = numpy.array([tag, dim])
+        for entity in gmsh.model.getEntitiesForPhysicalGroup(dim, tag):
+            entity_physicals.setdefault((dim, int(entity)), []).append(tag)
+
+    save_all = not entity_physicals or gmsh.option.getNumber("Mesh.SaveAll") != 0
+
+    cells = {}
+    physical = {}
+    geometrical = {}
+    for dim, entity in gmsh.model.getEntities():
+        if save_all:
+            physicals = entity_physicals.get((dim, entity), [0])[:1]
+        else:
+            physicals = entity_physicals.get((dim, entity), [])
+        elem_types, _, elem_node_tags = gmsh.model.mesh.getElements(dim, entity)
+        for elem_type, tags in zip(elem_types, elem_node_tags):
+            key, num_nodes = _gmsh_to_meshio_type[elem_type]
+            data = tag_to_index[numpy.asarray(tags, dtype=int)].reshape(-1, num_nodes)
+            for phys in physicals:
+                cells.setdefault(key, []).append(data)
+                physical.setdefault(key, []).append(numpy.full(len(data), phys))
+                geometrical.setdefault(key, []).append(numpy.full(len(data), entity))
+
+    cells = {key: numpy.concatenate(value) for key, value in cells.items()}
+    cells = _gmsh_to_meshio_ordering(cells)
+
+    # Like in msh files, elements without a physical group have the tag 0.
+    cell_data = {
+        key: {
+            "gmsh:physical": numpy.concatenate(physical[key]),
+            "gmsh:geometrical": numpy.concatenate(geometrical[key]),
+        }
+        for key in cells
+    }
+
+    return meshio.Mesh(points, cells, cell_data=cell_data, field_data=field_data)
+
+
+def generate_mesh_in_process(geo_filename, dim, log, gmsh_arguments=None):
+    """Meshes a geo file with the Gmsh Python module and returns the result as
+    a meshio mesh. No mesh file is written. Gmsh's log is fed to `log`, a
+    :class:`pygmsh.gmsh_log.GmshLog`.
+    """
+    return generate_mesh_hierarchy_in_process(
+        geo_filename, dim, 0, log, gmsh_arguments
+    )[0]
+
+
+def generate_mesh_hierarchy_in_process(
+    geo_filename, dim, num_refinements, log, gmsh_arguments=None
+):
+    """Like :func:`generate_mesh_in_process`, but refines the mesh
+    `num_refinements` times and returns the list of all levels, coarsest
+    first.
+    """
+    import gmsh
+
+    if gmsh_arguments is None:
+        gmsh_arguments = []
+
+    gmsh.initialize(["gmsh"] + gmsh_arguments)
+    try:
+        # The log is printed by `log` if requested.
+        gmsh.option.setNumber("General.Terminal", 0)
+        gmsh.logger.start()
+        meshes = []
+        error = None
+        try:
+            gmsh.open(geo_filename)
+            gmsh.model.mesh.generate(dim)
+            meshes.append(extract_mesh(gmsh))
+            for _ in range(num_refinements):
+                gmsh.model.mesh.refine()
+                meshes.append(extract_mesh(gmsh))
+        except Exception as e:  # pylint: disable=broad-except
+            error = str(e)
+        for line in gmsh.logger.get():
+            log(line)
+        gmsh.logger.stop()
+        if error is not None:
+            raise log.error("Gmsh exited with error ({}).".format(error))
+    finally:
+        gmsh.finalize()
+    return meshes
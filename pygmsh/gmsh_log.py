@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+#
+from __future__ import print_function
+
+import collections
+import logging
+import re
+
+logger = logging.getLogger("pygmsh")
+# Stay silent unless the application configures logging.
+logger.addHandler(logging.NullHandler())
+
+# "Info    : [ 40%] Meshing surface 3 (Plane, Frontal-Delaunay)"
+_LINE = re.compile(r"^(Info|Warning|Error|Debug)\s*:\s?(.*)$")
+_PROGRESS = re.compile(r"^\[\s*(\d+)%\]\s*(.*)$")
+_PHASE = re.compile(r"^(?:Meshing (\dD)|(Optimizing)|(Reading)|(Writing))\b.*\.\.\.$")
+
+_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+}
+
+
+class GmshError(RuntimeError):
+    """Raised when Gmsh fails. `log_tail` holds the last lines of Gmsh's
+    output, `returncode` the exit code of the Gmsh process (if there is one).
+    """
+
+    def __init__(self, message, returncode=None, log_tail=None):
+        super(GmshError, self).__init__(message)
+        self.returncode = returncode
+        self.log_tail = [] if log_tail is None else list(log_tail)
+        return
+
+    def __reduce__(self):
+        # for passing errors between processes
+        return (GmshError, (self.args[0], self.returncode, self.log_tail))
+
+
+def parse_line(line):
+    """Parses one line of Gmsh's output into an event, i.e., a dictionary with
+    the keys `"level"` (`"debug"`, `"info"`, `"warning"`, or `"error"`),
+    `"phase"` (e.g., `"2D"`; `None` if the line doesn't start a phase),
+    `"progress"` (percentage or `None`), and `"message"`.
+    """
+    line = line.rstrip()
+    m = _LINE.match(line)
+    if m is None:
+        level, message = "info", line
+    else:
+        level, message = m.group(1).lower(), m.group(2)
+
+    progress = None
+    m = _PROGRESS.match(message)
+    if m is not None:
+        progress = int(m.group(1))
+        message = m.group(2)
+
+    phase = None
+    m = _PHASE.match(message)
+    if m is not None:
+        dim, optimize, read, write = m.groups()
+        if dim is not None:
+            phase = dim
+        elif optimize is not None:
+            phase = "optimize"
+        elif read is not None:
+            phase = "read"
+        else:
+            phase = "write"
+
+    return {"level": level, "phase": phase, "progress": progress, "message": message}
+
+
+class GmshLog(object):
+    """Consumes Gmsh's output line by line. Every line is parsed into an event
+    (see :func:`parse_line`) that is handed to `callback` or, if there is no
+    callback, to the `pygmsh` logger. The event's `"phase"` is carried over to
+    all subsequent lines of the same phase. The last `tail_size` lines are
+    kept for error reports.
+
+    :param verbose: print every line as it comes in.
+    :param callback: called with every event.
+    :param tail_size: number of lines to keep.
+    :param line_callback: called with every raw line.
+    """
+
+    def __init__(self, verbose=False, callback=None, tail_size=100, line_callback=None):
+        self.verbose = verbose
+        self.callback = callback
+        self.line_callback = line_callback
+        self.tail = collections.deque(maxlen=tail_size)
+        self.phase = None
+        return
+
+    def __call__(self, line):
+        if self.verbose:
+            print(line, end="" if line.endswith("\n") else "\n")
+        if self.line_callback is not None:
+            self.line_callback(line)
+
+        event = parse_line(line)
+        self.tail.append(line.rstrip())
+        if event["phase"] is None:
+            event["phase"] = self.phase
+        else:
+            self.phase = event["phase"]
+
+        if self.callback is not None:
+            self.callback(event)
+        else:
+            level = _LEVELS[event["level"]]
+            if logger.isEnabledFor(level):
+                logger.log(level, "Gmsh: %s", event["message"])
+        return
+
+    def error(self, message, returncode=None):
+        """Returns a :class:`GmshError` carrying the tail of the log. Gmsh's
+        error messages (or, if there are none, the last lines) are appended to
+        `message`.
+        """
+        tail = list(self.tail)
+        details = [line for line in tail if line.startswith("Error")]
+        if not details:
+            details = tail[-10:]
+        if details:
+            message = "\n".join([message] + details)
+        return GmshError(message, returncode=returncode, log_tail=tail)
@@ -10,6 +10,11 @@ import numpy
 
 import meshio
 
+from . import msh_io
+from . import performance
+from .gmsh_log import GmshLog
+from .profiling import Profiler
+
 
 def rotation_matrix(u, theta):
     """Return matrix that implements the rotation around the vector :math:`u`
@@ -29,6 +34,14 @@ def rotation_matrix(u, theta):
     return R
 
 
+def _new_id_code(entity_id, query):
+    # Named entities get their tag from Gmsh's `newp`, `newl`, etc.; integer
+    # tags are used literally.
+    if entity_id.isdigit():
+        return []
+    return ["{} = {};".format(entity_id, query)]
+
+
 def _is_string(obj):
     try:
         # Python 2
@@ -64,85 +77,159 @@ def _get_gmsh_exe():
     return macos_gmsh_location if os.path.isfile(macos_gmsh_location) else "gmsh"
 
 
+_GMSH_VERSIONS = {}
+
+
+def _get_gmsh_version(gmsh_exe):
+    # Memoized; the mesh cache needs the version on every call.
+    if gmsh_exe not in _GMSH_VERSIONS:
+        _GMSH_VERSIONS[gmsh_exe] = (
+            subprocess.check_output([gmsh_exe, "--version"], stderr=subprocess.STDOUT)
+            .strip()
+            .decode("utf8")
+        )
+    return _GMSH_VERSIONS[gmsh_exe]
+
+
 def get_gmsh_major_version(gmsh_exe=_get_gmsh_exe()):
-    out = (
-        subprocess.check_output([gmsh_exe, "--version"], stderr=subprocess.STDOUT)
-        .strip()
-        .decode("utf8")
-    )
-    ex = out.split(".")
+    ex = _get_gmsh_version(gmsh_exe).split(".")
     return int(ex[0])
 
 
-def generate_mesh(
-    geo_object,
-    verbose=True,
-    dim=3,
-    prune_vertices=True,
-    remove_faces=False,
-    gmsh_path=None,
-    extra_gmsh_arguments=None,
-    # for debugging purposes:
-    geo_filename=None,
-    fast_conversion=False,
+def _get_gmsh_command(
+    geo_filename, msh_filename, dim, filetype, gmsh_path=None, extra_gmsh_arguments=None
 ):
     if extra_gmsh_arguments is None:
         extra_gmsh_arguments = []
 
-    preserve_geo = geo_filename is not None
-    if geo_filename is None:
-        with tempfile.NamedTemporaryFile(suffix=".geo") as f:
-            geo_filename = f.name
-
-    with open(geo_filename, "w") as f:
-        f.write(geo_object.get_code())
-
-    # Gmsh's native file format `msh` it not well suited for fast i/o. This can
-    # greatly reduce the performance of pygmsh. As a workaround, use the VTK
-    # format. Unfortunately, gmsh doesn't support physical and geometrical tags
-    # for VTK yet. <https://gitlab.onelab.info/gmsh/gmsh/issues/389>
-    if fast_conversion:
-        filetype = "vtk"
-        suffix = ".vtk"
-    else:
-        filetype = "msh"
-        suffix = ".msh"
-
-    with tempfile.NamedTemporaryFile(suffix=suffix) as handle:
-        msh_filename = handle.name
-
     gmsh_executable = gmsh_path if gmsh_path is not None else _get_gmsh_exe()
 
     args = [
         "-{}".format(dim),
         geo_filename,
-        # Don't use the native msh format. It's not very well suited for
-        # efficient reading as every cell has to be read individually.
+        # Binary msh 4.1 is read block by block by msh_io; other formats
+        # (`fast_conversion` gives VTK) go through meshio.
         "-format",
         filetype,
         "-bin",
         "-o",
         msh_filename,
     ] + extra_gmsh_arguments
+    return [gmsh_executable] + args
 
-    # https://stackoverflow.com/a/803421/353337
-    p = subprocess.Popen(
-        [gmsh_executable] + args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT
+
+def _run_gmsh(
+    geo_filename,
+    msh_filename,
+    dim,
+    filetype,
+    log,
+    gmsh_path=None,
+    extra_gmsh_arguments=None,
+):
+    command = _get_gmsh_command(
+        geo_filename, msh_filename, dim, filetype, gmsh_path, extra_gmsh_arguments
     )
-    if verbose:
-        while True:
-            line = p.stdout.readline()
-            if not line:
-                break
-            print(line.decode("utf-8"), end="")
+    _run(command, log)
+    return
+
+
+def _run(command, log):
+    # https://stackoverflow.com/a/803421/353337
+    p = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    while True:
+        line = p.stdout.readline()
+        if not line:
+            break
+        log(line.decode("utf-8", "replace"))
 
     p.communicate()
-    assert p.returncode == 0, "Gmsh exited with error (return code {}).".format(
-        p.returncode
-    )
+    if p.returncode != 0:
+        raise log.error(
+            "Gmsh exited with error (return code {}).".format(p.returncode),
+            returncode=p.returncode,
+        )
+    return
+
+
+def _get_parameter_arguments(parameters):
+    """Returns the Gmsh arguments that set the given parameters.
+    """
+    arguments = []
+    for name in sorted(parameters):
+        arguments += ["-setnumber", name, repr(float(parameters[name]))]
+    return arguments
+
+
+def _write_geo(geo_filename, geo_object, code=None, header=None, footer=None):
+    """Writes the `header` lines, the code, and the `footer` lines to
+    `geo_filename`. Unless `code` is given, the code of `geo_object` is
+    streamed to the file (if the object has `write_code`).
+    """
+    with open(geo_filename, "w") as f:
+        for line in header or []:
+            f.write(line + "\n")
+        if code is not None:
+            f.write(code)
+        elif hasattr(geo_object, "write_code"):
+            geo_object.write_code(f)
+        else:
+            f.write(geo_object.get_code())
+        for line in footer or []:
+            f.write("\n" + line)
+    return
+
+
+def _read_mesh(filename, filetype, index_dtype=None, coord_dtype=None):
+    if filetype == "msh":
+        return msh_io.read(filename, index_dtype=index_dtype, coord_dtype=coord_dtype)
+    mesh = meshio.read(filename)
+    msh_io.convert_dtypes(mesh, index_dtype, coord_dtype)
+    return mesh
+
+
+def _prune_vertices(mesh):
+    """Removes all points which don't belong to any cell and renumbers the
+    cells accordingly.
+
+    This is O(n): Mark all referenced points in a boolean mask, and build the
+    old-to-new index lookup table as its cumulative sum. The cell arrays are
+    renumbered in place; nothing is done if all points are referenced.
+    """
+    is_used = numpy.zeros(len(mesh.points), dtype=bool)
+    for c in mesh.cells.values():
+        is_used[c.ravel()] = True
+
+    if is_used.all():
+        return
+
+    new_index = None
+    for key, c in mesh.cells.items():
+        if new_index is None or new_index.dtype != c.dtype:
+            new_index = numpy.cumsum(is_used, dtype=c.dtype)
+            new_index -= 1
+        if c.flags.c_contiguous and c.flags.writeable:
+            # Every entry of `c` is read before it's overwritten, so it's safe
+            # to take into `c` itself.
+            numpy.take(new_index, c, out=c, mode="clip")
+        else:
+            mesh.cells[key] = new_index[c]
+
+    mesh.points = mesh.points[is_used]
+    for key in mesh.point_data:
+        mesh.point_data[key] = mesh.point_data[key][is_used]
+    return
 
-    mesh = meshio.read(msh_filename)
 
+def _get_dim(geo_object, dim):
+    if dim is not None:
+        return dim
+    # Geometries that don't track their dimension are meshed in 3D. Gmsh meshes
+    # points along with the curves, so mesh at least in 1D.
+    return max(getattr(geo_object, "dimension", 3), 1)
+
+
+def _postprocess(mesh, remove_faces, prune_vertices):
     if remove_faces:
         # Only keep the cells of highest topological dimension; discard faces
         # and such.
@@ -161,25 +248,250 @@ def generate_mesh(
         mesh.cell_data = {key: mesh.cell_data[key] for key in keep_keys}
 
     if prune_vertices:
-        # Make sure to include only those vertices which belong to a cell.
-        ncells = numpy.concatenate([numpy.concatenate(c) for c in mesh.cells.values()])
-        uvertices, uidx = numpy.unique(ncells, return_inverse=True)
-
-        k = 0
-        for key in mesh.cells.keys():
-            n = numpy.prod(mesh.cells[key].shape)
-            mesh.cells[key] = uidx[k : k + n].reshape(mesh.cells[key].shape)
-            k += n
-
-        mesh.points = mesh.points[uvertices]
-        for key in mesh.point_data:
-            mesh.point_data[key] = mesh.point_data[key][uvertices]
-
-    # clean up
-    os.remove(msh_filename)
-    if preserve_geo:
-        print("\ngeo file: {}".format(geo_filename))
+        _prune_vertices(mesh)
+    return
+
+
+def generate_mesh(
+    geo_object,
+    verbose=True,
+    dim=None,
+    prune_vertices=True,
+    remove_faces=False,
+    gmsh_path=None,
+    extra_gmsh_arguments=None,
+    # for debugging purposes:
+    geo_filename=None,
+    fast_conversion=False,
+    session=None,
+    cache=None,
+    in_process=False,
+    index_dtype=None,
+    coord_dtype=None,
+    profile=False,
+    log_callback=None,
+    performance_profile=None,
+    num_threads=None,
+    only_physical=None,
+    cell_dims=None,
+    checkpoint_dir=None,
+    parameters=None,
+):
+    """Mesh the geometry with Gmsh and return points, cells, point data, cell
+    data, and field data.
+
+    The meshing dimension `dim` defaults to the highest dimension of the
+    entities in the geometry, so, e.g., a purely two-dimensional geometry
+    doesn't go through Gmsh's 3D stage.
+
+    If a :class:`pygmsh.GmshSession` is given as `session`, the mesh is
+    generated by one of its warm Gmsh workers instead of a fresh `gmsh`
+    process. In this case, command line arguments must be passed to the
+    session, not via `extra_gmsh_arguments`.
+
+    If `in_process` is `True` and the Gmsh Python module is available, the mesh
+    is generated by Gmsh inside this process and the node and element arrays
+    are taken from Gmsh directly, without writing and parsing a mesh file.
+    Otherwise, `gmsh` is run as a subprocess.
+
+    `index_dtype` and `coord_dtype` set the types of the cell and point arrays,
+    e.g., `numpy.int32` and `numpy.float32` to halve the memory footprint.
+    Binary msh files are read directly into arrays of these types (unless a
+    `cache` is used; cached meshes keep the original types and are converted
+    after the lookup). A `ValueError` is raised if `index_dtype` can't index
+    all points.
+
+    If a :class:`pygmsh.MeshCache` is given as `cache`, the mesh is looked up
+    in the cache first and Gmsh is only invoked on a miss. Vertex pruning and
+    face removal are applied after the lookup, so they don't affect the cache
+    key.
+
+    `performance_profile` selects a set of Gmsh options: `"fast"` (Delaunay
+    2D, parallel HXT 3D, no optimization), `"balanced"` (Frontal-Delaunay 2D,
+    HXT 3D, optimization), or `"quality"` (Frontal-Delaunay 2D, Delaunay 3D,
+    Gmsh and Netgen optimization). `num_threads` sets the number of threads
+    Gmsh may use overall and in the 1D, 2D, and 3D meshers; with a profile, it
+    defaults to the number of CPUs. The options are prepended to the Gmsh code,
+    so they apply to all backends and are part of the cache key.
+
+    `only_physical` (a list of physical group labels) and `cell_dims` (a list
+    of dimensions) restrict the mesh to the elements of the given physical
+    groups and dimensions. This is done by Gmsh, so the other elements are
+    never written or parsed. If the geometry has no physical groups, a group is
+    created for each of the `cell_dims`. Physical groups added via raw code are
+    dropped in either case. A `ValueError` is raised if no physical group is
+    selected.
+
+    If `checkpoint_dir` is given, the model of a
+    :class:`pygmsh.opencascade.Geometry`, i.e., the result of its boolean
+    operations, is exported once to a `.brep` checkpoint in that directory and
+    loaded from there in all subsequent runs with the same model, even if the
+    global mesh sizes differ. See
+    :func:`pygmsh.checkpoint.get_checkpoint_code` for the limitations.
+
+    `parameters` maps the names of parameters defined with
+    :meth:`pygmsh.built_in.Geometry.parameter` to their values for this run.
+    They're passed to Gmsh as `-setnumber` arguments, so the code of the
+    geometry doesn't change.
+
+    If `profile` is `True`, a report with the wall and CPU time of every stage,
+    the file sizes, the number of cells per type, and Gmsh's own meshing times
+    is appended to the returned tuple; see :class:`pygmsh.profiling.Profiler`
+    for its layout. If `profile` is a callable, it is called with the report
+    instead (e.g., to forward the numbers to a metrics system), and the return
+    value is unchanged.
+
+    Gmsh's output is parsed into events (see
+    :func:`pygmsh.gmsh_log.parse_line`) which are passed to `log_callback` or,
+    if it's `None`, to the `pygmsh` logger. If Gmsh fails, a
+    :class:`pygmsh.GmshError` is raised that carries the tail of the log.
+    """
+    if extra_gmsh_arguments is None:
+        extra_gmsh_arguments = []
+    if parameters is not None:
+        assert session is None, "Pass parameters to the session's arguments."
+        extra_gmsh_arguments = extra_gmsh_arguments + _get_parameter_arguments(
+            parameters
+        )
+
+    # The native binary msh files are read directly by msh_io, with all
+    # physical and geometrical tags. `fast_conversion` (VTK output, read by
+    # meshio) is kept for compatibility; it's no faster anymore, and Gmsh
+    # doesn't write the tags to VTK files.
+    # <https://gitlab.onelab.info/gmsh/gmsh/issues/389>
+    if fast_conversion:
+        filetype = "vtk"
+        suffix = ".vtk"
     else:
-        os.remove(geo_filename)
+        filetype = "msh"
+        suffix = ".msh"
+
+    # avoid circular import
+    from . import checkpoint, gmsh_api
 
-    return mesh.points, mesh.cells, mesh.point_data, mesh.cell_data, mesh.field_data
+    dim = _get_dim(geo_object, dim)
+    profiler = Profiler()
+    log = GmshLog(
+        verbose=verbose, callback=log_callback, line_callback=profiler.parse_gmsh_line
+    )
+
+    with profiler.stage("get_code"):
+        if checkpoint_dir is not None:
+            code = checkpoint.get_checkpoint_code(
+                geo_object, checkpoint_dir, log, gmsh_path
+            )
+        elif cache is not None:
+            code = geo_object.get_code()
+        else:
+            # The code is streamed to the geo file instead.
+            code = None
+        header = []
+        if performance_profile is not None or num_threads is not None:
+            header.append(performance.get_code(performance_profile, num_threads))
+        footer = []
+        if only_physical is not None or cell_dims is not None:
+            footer.append(
+                geo_object._get_physical_selection_code(only_physical, cell_dims)
+            )
+
+    if in_process:
+        # Fall back to the subprocess if Gmsh's Python module isn't there.
+        in_process = gmsh_api.has_gmsh_module()
+
+    mesh = None
+    if cache is not None:
+        if session is not None:
+            gmsh_arguments = session.gmsh_arguments
+            gmsh_version = session.gmsh_version
+            # Meshes taken from Gmsh directly carry all tags, whatever the
+            # file type.
+            filetype = "api"
+        elif in_process:
+            import gmsh
+
+            gmsh_arguments = extra_gmsh_arguments
+            gmsh_version = gmsh.__version__
+            filetype = "api"
+        else:
+            gmsh_arguments = extra_gmsh_arguments
+            gmsh_version = _get_gmsh_version(
+                gmsh_path if gmsh_path is not None else _get_gmsh_exe()
+            )
+        with profiler.stage("cache_load"):
+            cache_key = cache.key(
+                "\n".join(header + [code] + footer),
+                dim,
+                gmsh_arguments,
+                gmsh_version,
+                filetype,
+            )
+            mesh = cache.load(cache_key)
+
+    preserve_geo = geo_filename is not None
+    if mesh is None:
+        if geo_filename is None:
+            with tempfile.NamedTemporaryFile(suffix=".geo") as f:
+                geo_filename = f.name
+
+        with profiler.stage("write_geo"):
+            _write_geo(geo_filename, geo_object, code, header, footer)
+        profiler.file_size("geo_bytes", geo_filename)
+
+        if session is not None:
+            assert (
+                not extra_gmsh_arguments
+            ), "Pass extra Gmsh arguments to the session, not to generate_mesh."
+            with profiler.stage("gmsh"):
+                mesh = session.run(geo_filename, dim=dim, log=log)
+        elif in_process:
+            with profiler.stage("gmsh"):
+                mesh = gmsh_api.generate_mesh_in_process(
+                    geo_filename, dim, log, extra_gmsh_arguments
+                )
+        else:
+            with tempfile.NamedTemporaryFile(suffix=suffix) as handle:
+                msh_filename = handle.name
+
+            with profiler.stage("gmsh"):
+                _run_gmsh(
+                    geo_filename,
+                    msh_filename,
+                    dim,
+                    filetype,
+                    log,
+                    gmsh_path,
+                    extra_gmsh_arguments,
+                )
+            profiler.file_size("msh_bytes", msh_filename)
+            with profiler.stage("read"):
+                if cache is None:
+                    mesh = _read_mesh(msh_filename, filetype, index_dtype, coord_dtype)
+                else:
+                    # Cache the mesh with the original types so that the entry
+                    # serves all `index_dtype`s and `coord_dtype`s; it's
+                    # converted below.
+                    mesh = _read_mesh(msh_filename, filetype)
+            os.remove(msh_filename)
+
+        # clean up
+        if preserve_geo:
+            print("\ngeo file: {}".format(geo_filename))
+        else:
+            os.remove(geo_filename)
+
+        if cache is not None:
+            with profiler.stage("cache_store"):
+                cache.store(cache_key, mesh)
+
+    with profiler.stage("postprocess"):
+        # No-op if the mesh has been read with the right types already
+        msh_io.convert_dtypes(mesh, index_dtype, coord_dtype)
+        _postprocess(mesh, remove_faces, prune_vertices)
+    profiler.count_cells(mesh.cells)
+
+    out = mesh.points, mesh.cells, mesh.point_data, mesh.cell_data, mesh.field_data
+    if callable(profile):
+        profile(profiler.report)
+    elif profile:
+        out += (profiler.report,)
+    return out
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+#
+import os
+import tempfile
+
+import numpy
+
+from . import msh_io
+from .gmsh_log import GmshLog
+from .helpers import (
+    _get_dim,
+    _get_gmsh_exe,
+    _postprocess,
+    _read_mesh,
+    _run,
+    _write_geo,
+)
+
+
+def generate_mesh_hierarchy(
+    geo_object,
+    num_refinements,
+    verbose=True,
+    dim=None,
+    prune_vertices=True,
+    remove_faces=False,
+    gmsh_path=None,
+    extra_gmsh_arguments=None,
+    in_process=False,
+    index_dtype=None,
+    coord_dtype=None,
+    log_callback=None,
+):
+    """Mesh the geometry and refine the mesh uniformly `num_refinements` times
+    in one Gmsh run, i.e., the geometry is processed only once.
+
+    Returns a list of `num_refinements + 1` meshes, coarsest first, each in the
+    format of :func:`pygmsh.generate_mesh`, and a list of `num_refinements`
+    vertex maps. `vertex_maps[k][i]` is the index in mesh `k + 1` of vertex `i`
+    of mesh `k`. (Gmsh's refinement keeps all vertices and adds new ones on
+    the edges.)
+
+    With `in_process` set, the Gmsh Python module is used if available, and no
+    mesh files are written. The other arguments are as in
+    :func:`pygmsh.generate_mesh`.
+    """
+    if extra_gmsh_arguments is None:
+        extra_gmsh_arguments = []
+    assert num_refinements >= 0
+
+    # avoid circular import
+    from . import gmsh_api
+
+    dim = _get_dim(geo_object, dim)
+    log = GmshLog(verbose=verbose, callback=log_callback)
+
+    if in_process:
+        # Fall back to the subprocess if Gmsh's Python module isn't there.
+        in_process = gmsh_api.has_gmsh_module()
+
+    with tempfile.NamedTemporaryFile(suffix=".geo") as f:
+        geo_filename = f.name
+
+    if in_process:
+        _write_geo(geo_filename, geo_object)
+        try:
+            meshes = gmsh_api.generate_mesh_hierarchy_in_process(
+                geo_filename, dim, num_refinements, log, extra_gmsh_arguments
+            )
+        finally:
+            os.remove(geo_filename)
+    else:
+        msh_filenames = []
+        for _ in range(num_refinements + 1):
+            with tempfile.NamedTemporaryFile(suffix=".msh") as f:
+                msh_filenames.append(f.name)
+
+        # Mesh, then save and refine level by level.
+        footer = ["Mesh.Binary = 1;", "Mesh {};".format(dim)]
+        for k, msh_filename in enumerate(msh_filenames):
+            if k > 0:
+                footer.append("RefineMesh;")
+            footer.append('Save "{}";'.format(msh_filename))
+        # trailing newline
+        footer.append("")
+
+        _write_geo(geo_filename, geo_object, footer=footer)
+
+        gmsh_executable = gmsh_path if gmsh_path is not None else _get_gmsh_exe()
+        # `-` makes Gmsh exit after parsing the file.
+        command = [gmsh_executable, geo_filename, "-"] + extra_gmsh_arguments
+        try:
+            _run(command, log)
+            meshes = [
+                _read_mesh(msh_filename, "msh", index_dtype, coord_dtype)
+                for msh_filename in msh_filenames
+            ]
+        finally:
+            for filename in [geo_filename] + msh_filenames:
+                if os.path.exists(filename):
+                    os.remove(filename)
+
+    for mesh in meshes:
+        # No-op if the mesh has been read with the right types already
+        msh_io.convert_dtypes(mesh, index_dtype, coord_dtype)
+        _postprocess(mesh, remove_faces, prune_vertices)
+
+    vertex_maps = [
+        _get_vertex_map(coarse.points, fine.points)
+        for coarse, fine in zip(meshes[:-1], meshes[1:])
+    ]
+    meshes = [
+        (mesh.points, mesh.cells, mesh.point_data, mesh.cell_data, mesh.field_data)
+        for mesh in meshes
+    ]
+    return meshes, vertex_maps
+
+
+def _get_vertex_map(coarse_points, fine_points):
+    """Returns the indices of the coarse points in the fine points. The coarse
+    points must be exact copies of some fine points.
+    """
+    # Sort the fine points lexicographically (as rows), then look up the
+    # coarse points by binary search.
+    dtype = [(name, fine_points.dtype) for name in ["x", "y", "z"]]
+    fine = numpy.ascontiguousarray(fine_points).view(dtype).ravel()
+    coarse = (
+        numpy.ascontiguousarray(coarse_points, dtype=fine_points.dtype)
+        .view(dtype)
+        .ravel()
+    )
+    order = numpy.argsort(fine)
+    idx = numpy.searchsorted(fine[order], coarse)
+    idx[idx == len(fine)] = 0
+    vertex_map = order[idx]
+    assert numpy.all(fine[vertex_map] == coarse), "Coarse vertices missing."
+    return vertex_map
@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+# Fast reader for the binary msh files (format version 4.1) that Gmsh writes
+# with `-bin`, cf. <https://gmsh.info/doc/texinfo/gmsh.html#MSH-file-format>.
+# Node and element blocks are read in one go with `numpy.frombuffer` from a
+# memory-mapped file. Physical and geometrical tags are kept. Anything else is
+# handed over to meshio.
+#
+import mmap
+import shlex
+
+import numpy
+import meshio
+
+
+# Gmsh element type -> (meshio cell type, number of nodes)
+_gmsh_to_meshio_type = {
+    1: ("line", 2),
+    2: ("triangle", 3),
+    3: ("quad", 4),
+    4: ("tetra", 4),
+    5: ("hexahedron", 8),
+    6: ("wedge", 6),
+    7: ("pyramid", 5),
+    8: ("line3", 3),
+    9: ("triangle6", 6),
+    10: ("quad9", 9),
+    11: ("tetra10", 10),
+    12: ("hexahedron27", 27),
+    13: ("wedge18", 18),
+    14: ("pyramid14", 14),
+    15: ("vertex", 1),
+    16: ("quad8", 8),
+    17: ("hexahedron20", 20),
+    18: ("wedge15", 15),
+    19: ("pyramid13", 13),
+}
+
+
+def _gmsh_to_meshio_ordering(cells):
+    # Gmsh cells are mostly ordered like VTK, with a few exceptions.
+    if "tetra10" in cells:
+        cells["tetra10"] = cells["tetra10"][:, [0, 1, 2, 3, 4, 5, 6, 7, 9, 8]]
+    if "hexahedron20" in cells:
+        cells["hexahedron20"] = cells["hexahedron20"][
+            :, [0, 1, 2, 3, 4, 5, 6, 7, 8, 11, 16, 9, 17, 10, 18, 19, 12, 15, 13, 14]
+        ]
+    return cells
+
+
+class _Unsupported(Exception):
+    pass
+
+
+class _Buffer(object):
+    def __init__(self, buf):
+        self.buf = buf
+        self.pos = 0
+        return
+
+    def readline(self):
+        end = self.buf.find(b"\n", self.pos)
+        if end == -1:
+            end = len(self.buf)
+        line = self.buf[self.pos : end]
+        self.pos = end + 1
+        return line.decode("utf-8").strip()
+
+    def array(self, dtype, count):
+        dtype = numpy.dtype(dtype)
+        out = numpy.frombuffer(self.buf, dtype=dtype, count=count, offset=self.pos)
+        self.pos += count * dtype.itemsize
+        return out
+
+    def skip_to(self, line):
+        pos = self.buf.find(line.encode("utf-8"), self.pos)
+        if pos == -1:
+            raise _Unsupported()
+        self.pos = pos
+        assert self.readline() == line
+        return
+
+
+def check_index_dtype(index_dtype, num_points):
+    """Raises a `ValueError` if `index_dtype` can't hold all point indices.
+    """
+    if index_dtype is None:
+        return
+    if num_points - 1 > numpy.iinfo(index_dtype).max:
+        raise ValueError(
+            "index_dtype {} cannot hold the indices of {} points.".format(
+                numpy.dtype(index_dtype), num_points
+            )
+        )
+    return
+
+
+def read(filename, index_dtype=None, coord_dtype=None):
+    """Reads a Gmsh msh file. Binary msh 4.1 files are read natively, all others
+    with meshio.
+
+    Binary msh 4.1 files are read directly into cell arrays of type
+    `index_dtype` and point arrays of type `coord_dtype` (default: `int` and
+    `float`); other files are converted after reading.
+    """
+    try:
+        with open(filename, "rb") as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            mesh = _read_buffer(_Buffer(buf), index_dtype, coord_dtype)
+        finally:
+            try:
+                buf.close()
+            except BufferError:
+                # There are views into the buffer left; the garbage collector
+                # will close it.
+                pass
+    except _Unsupported:
+        mesh = meshio.read(filename)
+        convert_dtypes(mesh, index_dtype, coord_dtype)
+    return mesh
+
+
+def convert_dtypes(mesh, index_dtype=None, coord_dtype=None):
+    """Converts the cell and point arrays of a mesh in place (no copy if they
+    already have the right type).
+    """
+    if index_dtype is not None:
+        check_index_dtype(index_dtype, len(mesh.points))
+        for key in mesh.cells:
+            mesh.cells[key] = mesh.cells[key].astype(index_dtype, copy=False)
+    if coord_dtype is not None:
+        mesh.points = mesh.points.astype(coord_dtype, copy=False)
+    return
+
+
+def _read_buffer(f, index_dtype, coord_dtype):
+    line = f.readline()
+    while line == "$Comments":
+        f.skip_to("$EndComments")
+        line = f.readline()
+
+    if line != "$MeshFormat":
+        raise _Unsupported()
+    fmt_version, file_type, data_size = f.readline().split()
+    if fmt_version != "4.1" or file_type != "1":
+        raise _Unsupported()
+    # The integer 1, for detecting the endianness
+    if f.array("i", 1)[0] != 1:
+        raise _Unsupported()
+    f.readline()
+    if f.readline() != "$EndMeshFormat":
+        raise _Unsupported()
+
+    c_size_t = numpy.dtype("u{}".format(data_size))
+
+    field_data = {}
+    physical_tags = tuple({} for _ in range(4))
+    points = None
+    cells = {}
+    cell_data = {}
+    while True:
+        line = f.readline()
+        if not line:
+            # EOF
+            break
+        assert line[0] == "$"
+        environ = line[1:]
+
+        if environ == "PhysicalNames":
+            _read_physical_names(f, field_data)
+        elif environ == "Entities":
+            physical_tags = _read_entities(f, c_size_t)
+        elif environ == "Nodes":
+            points, tag_to_index = _read_nodes(f, c_size_t, index_dtype, coord_dtype)
+        elif environ == "Elements":
+            cells, cell_data = _read_elements(f, c_size_t, tag_to_index, physical_tags)
+        elif environ in ["Periodic", "GhostElements", "Parametrizations"]:
+            # not part of the returned mesh
+            f.skip_to("$End" + environ)
+        else:
+            # data, partitioned entities, etc.
+            raise _Unsupported()
+
+    if points is None:
+        raise _Unsupported()
+
+    return meshio.Mesh(points, cells, cell_data=cell_data, field_data=field_data)
+
+
+def _read_physical_names(f, field_data):
+    num_names = int(f.readline())
+    for _ in range(num_names):
+        dim, tag, name = shlex.split(f.readline())
+        field_data[name] = numpy.array([int(tag), int(dim)])
+    assert f.readline() == "$EndPhysicalNames"
+    return
+
+
+def _read_entities(f, c_size_t):
+    physical_tags = tuple({} for _ in range(4))
+    number = f.array(c_size_t, 4)
+    for dim, n in enumerate(number):
+        for _ in range(n):
+            tag = int(f.array("i", 1)[0])
+            # discard bounding box
+            f.array("d", 3 if dim == 0 else 6)
+            num_physicals = int(f.array(c_size_t, 1)[0])
+            physical_tags[dim][tag] = f.array("i", num_physicals)
+            if dim > 0:
+                # discard bounding entities
+                num_bounding = int(f.array(c_size_t, 1)[0])
+                f.array("i", num_bounding)
+    f.readline()
+    assert f.readline() == "$EndEntities"
+    return physical_tags
+
+
+def _read_nodes(f, c_size_t, index_dtype, coord_dtype):
+    num_blocks, num_nodes, _, max_tag = (int(k) for k in f.array(c_size_t, 4))
+    check_index_dtype(index_dtype, num_nodes)
+
+    # The coordinates are converted as they're copied out of the buffer, and
+    # the lookup table determines the type of the cell arrays; no full-size
+    # conversion is needed afterwards.
+    points = numpy.empty((num_nodes, 3), dtype=coord_dtype or float)
+    tag_to_index = numpy.full(max_tag + 1, -1, dtype=index_dtype or int)
+
+    k = 0
+    for _ in range(num_blocks):
+        dim, _, parametric = f.array("i", 3)
+        n = int(f.array(c_size_t, 1)[0])
+        tags = f.array(c_size_t, n)
+        tag_to_index[tags] = numpy.arange(k, k + n)
+        # Parametric nodes have `dim` additional coordinates.
+        width = 3 + dim if parametric else 3
+        points[k : k + n] = f.array("d", n * width).reshape(n, width)[:, :3]
+        k += n
+
+    f.readline()
+    assert f.readline() == "$EndNodes"
+    return points, tag_to_index
+
+
+def _read_elements(f, c_size_t, tag_to_index, physical_tags):
+    num_blocks = int(f.array(c_size_t, 4)[0])
+
+    cells = {}
+    physical = {}
+    geometrical = {}
+    for _ in range(num_blocks):
+        dim, entity, elem_type = (int(k) for k in f.array("i", 3))
+        n = int(f.array(c_size_t, 1)[0])
+        try:
+            key, num_nodes = _gmsh_to_meshio_type[elem_type]
+        except KeyError:
+            raise _Unsupported()
+
+        # elementTag nodeTag ... for each element; discard the element tag
+        data = f.array(c_size_t, n * (1 + num_nodes)).reshape(n, 1 + num_nodes)
+        cells.setdefault(key, []).append(tag_to_index[data[:, 1:]])
+
+        phys = physical_tags[dim].get(entity)
+        physical.setdefault(key, []).append(
+            numpy.full(n, phys[0] if phys is not None and len(phys) > 0 else 0)
+        )
+        geometrical.setdefault(key, []).append(numpy.full(n, entity))
+
+    f.readline()
+    assert f.readline() == "$EndElements"
+
+    cells = {
+        key: value[0] if len(value) == 1 else numpy.concatenate(value)
+        for key, value in cells.items()
+    }
+    cells = _gmsh_to_meshio_ordering(cells)
+
+    cell_data = {
+        key: {
+            "gmsh:physical": numpy.concatenate(physical[key]),
+            "gmsh:geometrical": numpy.concatenate(geometrical[key]),
+        }
+        for key in cells
+    }
+    return cells, cell_data
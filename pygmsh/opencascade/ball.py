@@ -26,24 +26,32 @@ class Ball(VolumeBase):
         If specified, sets the `Characteristic Length` property.
     """
 
-    def __init__(self, center, radius, x0=None, x1=None, alpha=None, char_length=None):
-        super(Ball, self).__init__()
+    __slots__ = ("center", "radius", "x0", "x1", "alpha", "char_length")
 
-        self.center = center
+    def __init__(
+        self, center, radius, x0=None, x1=None, alpha=None, char_length=None, id0=None
+    ):
+        super(Ball, self).__init__(id0=id0)
+
+        self.center = list(center)
         self.radius = radius
+        self.x0 = x0
+        self.x1 = x1
+        self.alpha = alpha
         self.char_length = char_length
+        return
 
-        args = list(center) + [radius]
-        if x0 is not None:
-            args.append(x0)
-            if x1 is not None:
-                args.append(x1)
-                if alpha is not None:
-                    args.append(alpha)
+    @property
+    def code(self):
+        args = list(self.center) + [self.radius]
+        if self.x0 is not None:
+            args.append(self.x0)
+            if self.x1 is not None:
+                args.append(self.x1)
+                if self.alpha is not None:
+                    args.append(self.alpha)
         args = ", ".join(["{}".format(arg) for arg in args])
-
-        self.code = "\n".join(
+        return "\n".join(
             ["{} = newv;".format(self.id), "Sphere({}) = {{{}}};".format(self.id, args)]
-            + self.char_length_code(char_length)
+            + self.char_length_code(self.char_length)
         )
-        return
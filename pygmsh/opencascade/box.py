@@ -17,21 +17,24 @@ class Box(VolumeBase):
         Characteristic length of the mesh elements of this polygon.
     """
 
-    def __init__(self, x0, extents, char_length=None):
-        super(Box, self).__init__()
+    __slots__ = ("x0", "extents", "char_length")
+
+    def __init__(self, x0, extents, char_length=None, id0=None):
+        super(Box, self).__init__(id0=id0)
 
         assert len(x0) == 3
         assert len(extents) == 3
 
-        self.x0 = x0
-        self.extents = extents
+        self.x0 = list(x0)
+        self.extents = list(extents)
         self.char_length = char_length
+        return
 
-        args = list(x0) + list(extents)
+    @property
+    def code(self):
+        args = list(self.x0) + list(self.extents)
         args = ", ".join(["{}".format(arg) for arg in args])
-
-        self.code = "\n".join(
+        return "\n".join(
             ["{} = newv;".format(self.id), "Box({}) = {{{}}};".format(self.id, args)]
-            + self.char_length_code(char_length)
+            + self.char_length_code(self.char_length)
         )
-        return
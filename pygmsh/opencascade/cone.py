@@ -19,25 +19,31 @@ class Cone(VolumeBase):
         Angular opening of the the Cone.
     """
 
-    def __init__(self, center, axis, radius0, radius1, alpha=None, char_length=None):
-        super(Cone, self).__init__()
+    __slots__ = ("center", "axis", "radius0", "radius1", "alpha", "char_length")
+
+    def __init__(
+        self, center, axis, radius0, radius1, alpha=None, char_length=None, id0=None
+    ):
+        super(Cone, self).__init__(id0=id0)
 
         assert len(center) == 3
         assert len(axis) == 3
 
-        self.center = center
-        self.axis = axis
+        self.center = list(center)
+        self.axis = list(axis)
         self.radius0 = radius0
         self.radius1 = radius1
+        self.alpha = alpha
         self.char_length = char_length
+        return
 
-        args = list(center) + list(axis) + [radius0] + [radius1]
-        if alpha is not None:
-            args.append(alpha)
+    @property
+    def code(self):
+        args = list(self.center) + list(self.axis) + [self.radius0, self.radius1]
+        if self.alpha is not None:
+            args.append(self.alpha)
         args = ", ".join(["{}".format(arg) for arg in args])
-
-        self.code = "\n".join(
+        return "\n".join(
             ["{} = newv;".format(self.id), "Cone({}) = {{{}}};".format(self.id, args)]
-            + self.char_length_code(char_length)
+            + self.char_length_code(self.char_length)
         )
-        return
@@ -21,37 +21,31 @@ class Cylinder(VolumeBase):
         Characteristic length of the mesh elements of this polygon.
     """
 
-    def __init__(self, x0, axis, radius, angle=None, char_length=None):
-        super(Cylinder, self).__init__()
+    __slots__ = ("x0", "axis", "radius", "angle", "char_length")
+
+    def __init__(self, x0, axis, radius, angle=None, char_length=None, id0=None):
+        super(Cylinder, self).__init__(id0=id0)
 
         assert len(x0) == 3
         assert len(axis) == 3
 
-        self.x0 = x0
-        self.axis = axis
+        self.x0 = list(x0)
+        self.axis = list(axis)
         self.radius = radius
         self.angle = angle
         self.char_length = char_length
+        return
 
-        args = list(x0) + list(axis) + [radius]
-        if angle is not None:
-            args.append(angle)
+    @property
+    def code(self):
+        args = list(self.x0) + list(self.axis) + [self.radius]
+        if self.angle is not None:
+            args.append(self.angle)
         args = ", ".join(["{}".format(arg) for arg in args])
-
-        code = [
-            "{} = newv;".format(self.id),
-            "Cylinder({}) = {{{}}};".format(self.id, args),
-        ]
-
-        if self.char_length:
-            code.extend(
-                [
-                    "pts_{}[] = PointsOf{{Volume{{{}}};}};".format(self.id, self.id),
-                    "Characteristic Length{{pts_{}[]}} = {};".format(
-                        self.id, char_length
-                    ),
-                ]
-            )
-
-        self.code = "\n".join(code)
-        return
+        return "\n".join(
+            [
+                "{} = newv;".format(self.id),
+                "Cylinder({}) = {{{}}};".format(self.id, args),
+            ]
+            + self.char_length_code(self.char_length)
+        )
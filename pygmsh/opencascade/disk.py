@@ -19,26 +19,28 @@ class Disk(SurfaceBase):
         Characteristic length of the mesh elements of this polygon.
     """
 
-    def __init__(self, x0, radius0, radius1=None, char_length=None):
-        super(Disk, self).__init__()
+    __slots__ = ("x0", "radius0", "radius1", "char_length")
+
+    def __init__(self, x0, radius0, radius1=None, char_length=None, id0=None):
+        super(Disk, self).__init__(id0=id0)
 
         assert len(x0) == 3
         if radius1 is not None:
             assert radius0 >= radius1
 
-        self.x0 = x0
+        self.x0 = list(x0)
         self.radius0 = radius0
         self.radius1 = radius1
         self.char_length = char_length
+        return
 
-        args = list(x0) + [radius0]
-        if radius1 is not None:
-            args.append(radius1)
-
+    @property
+    def code(self):
+        args = list(self.x0) + [self.radius0]
+        if self.radius1 is not None:
+            args.append(self.radius1)
         args = ", ".join(["{}".format(arg) for arg in args])
-
-        self.code = "\n".join(
+        return "\n".join(
             ["{} = news;".format(self.id), "Disk({}) = {{{}}};".format(self.id, args)]
-            + self.char_length_code(char_length)
+            + self.char_length_code(self.char_length)
         )
-        return
@@ -3,6 +3,8 @@
 
 
 class Dummy(object):
+    __slots__ = ("id",)
+
     def __init__(self, id0):
         self.id = id0
         return
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 #
+import itertools
+
 from ..__about__ import __version__
 
 from .. import built_in
@@ -19,69 +21,92 @@ from ..built_in import geometry as bl
 
 
 class Geometry(bl.Geometry):
-    def __init__(self, characteristic_length_min=None, characteristic_length_max=None):
-        super(Geometry, self).__init__()
+    def __init__(
+        self,
+        characteristic_length_min=None,
+        characteristic_length_max=None,
+        point_tolerance=None,
+    ):
+        super(Geometry, self).__init__(point_tolerance=point_tolerance)
         self._BOOLEAN_ID = 0
         self._EXTRUDE_ID = 0
         self._GMSH_CODE = [
             "// This code was created by pygmsh v{}.".format(__version__),
             'SetFactory("OpenCASCADE");',
         ]
+        # Kept apart from the model code, cf. _get_model_code().
+        self.characteristic_length_min = characteristic_length_min
+        self.characteristic_length_max = characteristic_length_max
+        return
 
-        if characteristic_length_min is not None:
-            self._GMSH_CODE.append(
-                "Mesh.CharacteristicLengthMin = {};".format(characteristic_length_min)
-            )
+    def _iter_code(self):
+        # The global mesh size settings go right after the factory.
+        return itertools.chain(
+            self._render(self._GMSH_CODE[:2]),
+            self._get_mesh_size_code(),
+            self._render(itertools.islice(self._GMSH_CODE, 2, None)),
+        )
 
-        if characteristic_length_max is not None:
-            self._GMSH_CODE.append(
-                "Mesh.CharacteristicLengthMax = {};".format(characteristic_length_max)
+    def _get_mesh_size_code(self):
+        code = []
+        if self.characteristic_length_min is not None:
+            code.append(
+                "Mesh.CharacteristicLengthMin = {};".format(
+                    self.characteristic_length_min
+                )
             )
-        return
+        if self.characteristic_length_max is not None:
+            code.append(
+                "Mesh.CharacteristicLengthMax = {};".format(
+                    self.characteristic_length_max
+                )
+            )
+        return code
 
-    def get_code(self):
-        """Returns properly formatted Gmsh code.
+    def _get_model_code(self):
+        """Returns the Gmsh code without the global mesh size settings, i.e.,
+        the code that defines the model.
         """
-        return "\n".join(self._GMSH_CODE)
+        return "\n".join(self._render(self._GMSH_CODE))
 
     def add_rectangle(self, *args, **kwargs):
-        p = Rectangle(*args, **kwargs)
-        self._GMSH_CODE.append(p.code)
+        p = Rectangle(*args, id0=self._new_tag("surface"), **kwargs)
+        self._append(p)
         return p
 
     def add_disk(self, *args, **kwargs):
-        p = Disk(*args, **kwargs)
-        self._GMSH_CODE.append(p.code)
+        p = Disk(*args, id0=self._new_tag("surface"), **kwargs)
+        self._append(p)
         return p
 
     def add_ball(self, *args, **kwargs):
-        p = Ball(*args, **kwargs)
-        self._GMSH_CODE.append(p.code)
+        p = Ball(*args, id0=self._new_tag("volume"), **kwargs)
+        self._append(p)
         return p
 
     def add_box(self, *args, **kwargs):
-        p = Box(*args, **kwargs)
-        self._GMSH_CODE.append(p.code)
+        p = Box(*args, id0=self._new_tag("volume"), **kwargs)
+        self._append(p)
         return p
 
     def add_cone(self, *args, **kwargs):
-        p = Cone(*args, **kwargs)
-        self._GMSH_CODE.append(p.code)
+        p = Cone(*args, id0=self._new_tag("volume"), **kwargs)
+        self._append(p)
         return p
 
     def add_cylinder(self, *args, **kwargs):
-        p = Cylinder(*args, **kwargs)
-        self._GMSH_CODE.append(p.code)
+        p = Cylinder(*args, id0=self._new_tag("volume"), **kwargs)
+        self._append(p)
         return p
 
     def add_torus(self, *args, **kwargs):
-        p = Torus(*args, **kwargs)
-        self._GMSH_CODE.append(p.code)
+        p = Torus(*args, id0=self._new_tag("volume"), **kwargs)
+        self._append(p)
         return p
 
     def add_wedge(self, *args, **kwargs):
-        p = Wedge(*args, **kwargs)
-        self._GMSH_CODE.append(p.code)
+        p = Wedge(*args, id0=self._new_tag("volume"), **kwargs)
+        self._append(p)
         return p
 
     def _boolean_operation(
@@ -162,6 +187,8 @@ class Geometry(bl.Geometry):
                 "tdelete": tool_delete,
             }
         )
+        self._raise_dimension(dim)
+        self._disable_integer_tags()
         mapping = {"Line": None, "Surface": SurfaceBase, "Volume": VolumeBase}
         return mapping[legal_dim_types[dim]](id0=name, is_list=True)
 
@@ -239,5 +266,7 @@ class Geometry(bl.Geometry):
 
         top = SurfaceBase(top)
         extruded = VolumeBase(is_list=False, id0=extruded)
+        self._raise_dimension(3)
+        self._disable_integer_tags()
 
         return top, extruded
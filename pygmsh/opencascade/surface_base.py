@@ -9,6 +9,8 @@ class SurfaceBase(built_in.surface_base.SurfaceBase):
     is created. Inherits from built_in SurfaceBase.
     """
 
+    __slots__ = ("is_list",)
+
     _ID = 0
     dimension = 2
 
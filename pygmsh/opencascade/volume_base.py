@@ -9,6 +9,8 @@ class VolumeBase(built_in.volume_base.VolumeBase):
     is created. Inherits from built_in VolumeBase.
     """
 
+    __slots__ = ("is_list",)
+
     _ID = 0
     dimension = 3
 
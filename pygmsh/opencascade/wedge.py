@@ -17,21 +17,24 @@ class Wedge(VolumeBase):
         Characteristic length of the mesh elements of this polygon.
     """
 
-    def __init__(self, x0, extents, top_extent=None, char_length=None):
-        super(Wedge, self).__init__()
+    __slots__ = ("x0", "extents", "top_extent", "char_length")
 
-        self.x0 = x0
-        self.extents = extents
+    def __init__(self, x0, extents, top_extent=None, char_length=None, id0=None):
+        super(Wedge, self).__init__(id0=id0)
+
+        self.x0 = list(x0)
+        self.extents = list(extents)
         self.top_extent = top_extent
         self.char_length = char_length
+        return
 
-        args = list(x0) + list(extents)
-        if top_extent is not None:
-            args.append(top_extent)
+    @property
+    def code(self):
+        args = list(self.x0) + list(self.extents)
+        if self.top_extent is not None:
+            args.append(self.top_extent)
         args = ", ".join(["{}".format(arg) for arg in args])
-
-        self.code = "\n".join(
+        return "\n".join(
             ["{} = newv;".format(self.id), "Wedge({}) = {{{}}};".format(self.id, args)]
-            + self.char_length_code(char_length)
+            + self.char_length_code(self.char_length)
         )
-        return
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+#
+import multiprocessing
+
+# Gmsh options of the performance profiles. The 3D algorithms are
+# 1 (Delaunay) and 10 (HXT, a parallel Delaunay), the 2D algorithms 5
+# (Delaunay) and 6 (Frontal-Delaunay).
+PROFILES = {
+    "fast": [("Mesh.Algorithm", 5), ("Mesh.Algorithm3D", 10), ("Mesh.Optimize", 0)],
+    "balanced": [
+        ("Mesh.Algorithm", 6),
+        ("Mesh.Algorithm3D", 10),
+        ("Mesh.Optimize", 1),
+    ],
+    "quality": [
+        ("Mesh.Algorithm", 6),
+        ("Mesh.Algorithm3D", 1),
+        ("Mesh.Optimize", 1),
+        ("Mesh.OptimizeNetgen", 1),
+    ],
+}
+
+
+def get_options(profile=None, num_threads=None):
+    """Returns the Gmsh options for a performance profile (`"fast"`,
+    `"balanced"`, or `"quality"`) and a number of threads as a list of
+    `(name, value)` pairs.
+
+    With a profile but no `num_threads`, all CPUs are used.
+    """
+    options = []
+    if profile is not None:
+        assert profile in PROFILES, "Unknown performance profile '{}'.".format(
+            profile
+        )
+        options += PROFILES[profile]
+        if num_threads is None:
+            num_threads = multiprocessing.cpu_count()
+
+    if num_threads is not None:
+        assert num_threads > 0
+        options += [
+            ("General.NumThreads", num_threads),
+            ("Mesh.MaxNumThreads1D", num_threads),
+            ("Mesh.MaxNumThreads2D", num_threads),
+            ("Mesh.MaxNumThreads3D", num_threads),
+        ]
+    return options
+
+
+def get_code(profile=None, num_threads=None):
+    """Returns the options of :func:`get_options` as Gmsh code.
+    """
+    return "\n".join(
+        "{} = {};".format(name, value)
+        for name, value in get_options(profile, num_threads)
+    )
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+#
+import contextlib
+import os
+import re
+import time
+
+# Gmsh 4: "Info    : Done meshing 2D (Wall 0.0126s, CPU 0.012s)"
+# Gmsh 3: "Info    : Done meshing 2D (0.012 s)"
+_GMSH_TIMING = re.compile(
+    r"Info\s*:\s*Done (meshing \dD|optimizing mesh) "
+    r"\((?:Wall ([-+.\deE]+)\s*s, CPU ([-+.\deE]+)\s*s|([-+.\deE]+)\s*s)\)"
+)
+
+
+def _cpu_time():
+    # includes the CPU time of terminated child processes, i.e., Gmsh
+    t = os.times()
+    return t[0] + t[1] + t[2] + t[3]
+
+
+class Profiler(object):
+    """Collects the report of :func:`pygmsh.generate_mesh` with `profile`
+    enabled. The report is a dictionary with the keys
+
+    - `"stages"`: wall and CPU time in seconds for each stage (`"get_code"`,
+      `"cache_load"`, `"write_geo"`, `"gmsh"`, `"read"`, `"cache_store"`,
+      `"postprocess"`) that was run,
+    - `"geo_bytes"`, `"msh_bytes"`: sizes of the geo and mesh files (`None` if
+      no such file was written),
+    - `"num_cells"`: number of cells per cell type in the returned mesh,
+    - `"gmsh"`: Gmsh's own wall and CPU times per meshing step (`"1D"`,
+      `"2D"`, `"3D"`, `"optimize"`), parsed from its log.
+    """
+
+    def __init__(self):
+        self.report = {
+            "stages": {},
+            "geo_bytes": None,
+            "msh_bytes": None,
+            "num_cells": {},
+            "gmsh": {},
+        }
+        return
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        wall0 = time.time()
+        cpu0 = _cpu_time()
+        try:
+            yield
+        finally:
+            self.report["stages"][name] = {
+                "wall": time.time() - wall0,
+                "cpu": _cpu_time() - cpu0,
+            }
+
+    def file_size(self, key, filename):
+        self.report[key] = os.path.getsize(filename)
+        return
+
+    def count_cells(self, cells):
+        self.report["num_cells"] = {key: len(value) for key, value in cells.items()}
+        return
+
+    def parse_gmsh_line(self, line):
+        m = _GMSH_TIMING.search(line)
+        if m is None:
+            return
+        step, wall, cpu, seconds = m.groups()
+        name = step[-2:] if step.startswith("meshing") else "optimize"
+        if seconds is not None:
+            # Gmsh 3 only reports one time.
+            wall = cpu = seconds
+        self.report["gmsh"][name] = {"wall": float(wall), "cpu": float(cpu)}
+        return
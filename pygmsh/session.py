@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+#
+import multiprocessing
+import threading
+
+try:
+    import queue
+except ImportError:
+    # Python 2
+    import Queue as queue
+
+from .gmsh_log import GmshLog
+
+
+def _worker(conn, gmsh_arguments):
+    """Worker loop. Imports Gmsh exactly once, then meshes one geo file after
+    another until it receives `None`. Gmsh is finalized and initialized again
+    for every job so that options set by one geo file (e.g., `Mesh.SaveAll`
+    or `General.NumThreads`) don't carry over into the next.
+    """
+    import gmsh
+
+    from .gmsh_api import extract_mesh
+
+    while True:
+        job = conn.recv()
+        if job is None:
+            break
+
+        geo_filename, dim = job
+        gmsh.initialize(["gmsh"] + gmsh_arguments)
+        # The log is sent back to the parent process.
+        gmsh.option.setNumber("General.Terminal", 0)
+        gmsh.logger.start()
+        try:
+            gmsh.open(geo_filename)
+            gmsh.model.mesh.generate(dim)
+            mesh = extract_mesh(gmsh)
+        except Exception as e:  # pylint: disable=broad-except
+            mesh, error = None, str(e)
+        else:
+            error = None
+        lines = gmsh.logger.get()
+        gmsh.logger.stop()
+        gmsh.finalize()
+        conn.send((mesh, error, lines))
+
+    conn.close()
+    return
+
+
+class GmshSession(object):
+    """A pool of warm Gmsh workers.
+
+    Every worker is a separate process that imports the Gmsh Python module only
+    once; afterwards, it is fed one geo file after another. Pass the session to
+    :func:`pygmsh.generate_mesh` to skip the process startup and module import
+    for each mesh. Gmsh itself is initialized afresh for every mesh, so all
+    options are back at their defaults (plus `gmsh_arguments`) for each job.
+    The session is thread-safe; with `num_workers > 1`, up to `num_workers`
+    meshes are generated concurrently. A worker that dies is replaced by a
+    new one.
+
+    :param num_workers: number of Gmsh worker processes
+    :param gmsh_arguments: command line arguments passed to each worker's
+        `gmsh.initialize()`, e.g., `["-nt", "4"]`.
+    """
+
+    def __init__(self, num_workers=1, gmsh_arguments=None):
+        # Fail early if the Gmsh Python module isn't available.
+        import gmsh
+
+        assert num_workers > 0
+        if gmsh_arguments is None:
+            gmsh_arguments = []
+
+        self.num_workers = num_workers
+        self.gmsh_arguments = gmsh_arguments
+        self.gmsh_version = gmsh.__version__
+
+        self._processes = []
+        self._connections = []
+        self._idle = queue.Queue()
+        # guards the lists of processes and connections
+        self._lock = threading.Lock()
+        self._close_lock = threading.Lock()
+        for _ in range(num_workers):
+            p, conn = self._start_worker()
+            self._processes.append(p)
+            self._connections.append(conn)
+            self._idle.put(conn)
+        return
+
+    def _start_worker(self):
+        parent_conn, child_conn = multiprocessing.Pipe()
+        p = multiprocessing.Process(
+            target=_worker, args=(child_conn, self.gmsh_arguments)
+        )
+        p.daemon = True
+        p.start()
+        child_conn.close()
+        return p, parent_conn
+
+    def _replace_worker(self, conn):
+        """Replaces the worker behind the broken connection `conn` by a new one
+        and returns the exit code of the old worker and the new connection.
+        """
+        with self._lock:
+            k = self._connections.index(conn)
+            p = self._processes[k]
+            new_p, new_conn = self._start_worker()
+            self._processes[k], self._connections[k] = new_p, new_conn
+        p.join(1.0)
+        if p.is_alive():
+            p.terminate()
+            p.join()
+        conn.close()
+        return p.exitcode, new_conn
+
+    def run(self, geo_filename, dim=3, verbose=True, log=None):
+        """Mesh `geo_filename` on the next idle worker and return the result as
+        a meshio mesh. The node and element arrays are sent back directly; no
+        mesh file is written.
+
+        Gmsh's log is fed to `log`, a :class:`pygmsh.gmsh_log.GmshLog` (by
+        default, one that prints the log if `verbose` is set). If Gmsh fails or
+        the worker dies (e.g., from a segfault in Gmsh), a
+        :class:`pygmsh.GmshError` is raised; a dead worker is replaced before.
+        """
+        assert self._processes, "The session has been closed."
+        if log is None:
+            log = GmshLog(verbose=verbose)
+
+        conn = self._idle.get()
+        try:
+            conn.send((geo_filename, dim))
+            mesh, error, lines = conn.recv()
+        except (EOFError, IOError, OSError):
+            exitcode, conn = self._replace_worker(conn)
+            raise log.error(
+                "The Gmsh worker died while meshing {} (exit code {}).".format(
+                    geo_filename, exitcode
+                ),
+                returncode=exitcode,
+            )
+        finally:
+            self._idle.put(conn)
+
+        for line in lines:
+            log(line)
+        if error is not None:
+            raise log.error("Gmsh exited with error ({}).".format(error))
+        return mesh
+
+    def close(self):
+        """Shut down all workers.
+        """
+        with self._close_lock:
+            with self._lock:
+                num_workers = len(self._connections)
+            # Wait for busy workers to finish their current job. A worker that
+            # dies meanwhile is replaced before its connection is put back.
+            for _ in range(num_workers):
+                conn = self._idle.get()
+                try:
+                    conn.send(None)
+                except (IOError, OSError):
+                    # The worker is dead already.
+                    pass
+                conn.close()
+            with self._lock:
+                for p in self._processes:
+                    p.join()
+                self._connections = []
+                self._processes = []
+        return
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+        return
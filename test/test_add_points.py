@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+#
+import copy
+
+import numpy
+
+import pygmsh
+
+from helpers import compute_volume
+
+
+def _circle(n):
+    t = numpy.linspace(0.0, 2 * numpy.pi, n, endpoint=False)
+    return numpy.column_stack([numpy.cos(t), numpy.sin(t), numpy.zeros(n)])
+
+
+def test():
+    geom = pygmsh.built_in.Geometry()
+    points = geom.add_points(_circle(100), lcar=0.1)
+    lines = [geom.add_line(points[k - 1], points[k]) for k in range(len(points))]
+    ll = geom.add_line_loop(lines)
+    geom.add_plane_surface(ll)
+
+    ref = 0.5 * 100 * numpy.sin(2 * numpy.pi / 100)
+    points, cells, _, _, _ = pygmsh.generate_mesh(geom)
+    assert abs(compute_volume(points, cells) - ref) < 1.0e-2 * ref
+    return
+
+
+def test_code():
+    geom = pygmsh.built_in.Geometry()
+    X = _circle(4)
+    points = geom.add_points(X, lcar=[0.1, 0.2, 0.3, 0.4])
+    assert len(points) == 4
+    assert points[-1].id == points.id + "+3"
+    assert numpy.all(points[1].x == X[1])
+    assert [p.id for p in points[1:3]] == [points.id + "+1", points.id + "+2"]
+    # one light point per index, without a copy of the coordinates
+    assert points[1] is points[1]
+    assert points[1].lcar == 0.2
+    assert numpy.shares_memory(points[1].x, points.x)
+    assert copy.deepcopy(points[1]).id == points[1].id
+
+    poly = geom.add_polygon(X, 0.1)
+    lines = poly.line_loop.lines
+    assert all(lines[k].points[1] is lines[k + 1].points[0] for k in range(3))
+
+    spline = geom.add_spline(points[:])
+    code = geom.get_code()
+    assert "{} = newp;".format(points.id) in code
+    assert "Point({}+0) = {{1.0, 0.0, 0.0, 0.1}};".format(points.id) in code
+    assert "Point({}+3) = {{{!r}, -1.0, 0.0, 0.4}};".format(
+        points.id, float(X[3, 0])
+    ) in code
+    assert "Spline({}) = {{{}+0, {}+1".format(spline.id, points.id, points.id) in code
+
+    geom = pygmsh.built_in.Geometry(integer_tags=True)
+    geom.add_point([0.0, 0.0, 0.0])
+    points = geom.add_points(X)
+    p = geom.add_point([2.0, 0.0, 0.0])
+    assert points.id == "2"
+    assert points[3].id == "5"
+    assert p.id == "6"
+    code = geom.get_code()
+    assert "Point(2) = {1.0, 0.0, 0.0};" in code
+    assert "Point(6) = {2.0, 0.0, 0.0};" in code
+    return
+
+
+if __name__ == "__main__":
+    test()
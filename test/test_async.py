@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+import os
+import sys
+
+import pytest
+
+import pygmsh
+
+from helpers import compute_volume
+from test_msh_io import _fake_gmsh
+
+
+@pytest.mark.skipif(sys.version_info < (3, 5), reason="requires Python >= 3.5")
+def test():
+    import asyncio
+
+    async def mesh_all(radii):
+        semaphore = asyncio.Semaphore(2)
+        tasks = []
+        for radius in radii:
+            geom = pygmsh.built_in.Geometry()
+            geom.add_circle([0.0, 0.0, 0.0], radius, lcar=0.1)
+            tasks.append(
+                pygmsh.generate_mesh_async(geom, verbose=False, semaphore=semaphore)
+            )
+        return await asyncio.gather(*tasks)
+
+    radii = [0.5, 1.0, 1.5]
+    loop = asyncio.new_event_loop()
+    try:
+        results = loop.run_until_complete(mesh_all(radii))
+    finally:
+        loop.close()
+
+    for radius, (points, cells, _, _, _) in zip(radii, results):
+        ref = 3.14159 * radius ** 2
+        assert abs(compute_volume(points, cells) - ref) < 1.0e-2 * ref
+    return
+
+
+@pytest.mark.skipif(sys.version_info < (3, 5), reason="requires Python >= 3.5")
+def test_options(tmpdir):
+    import asyncio
+    import numpy
+
+    geom = pygmsh.built_in.Geometry()
+    w = geom.parameter("w", 1.0)
+    poly = geom.add_rectangle(0.0, w, 0.0, 1.0, 0.0, 0.1)
+    geom.add_physical_surface(poly.surface, label="plate")
+
+    cache = pygmsh.MeshCache(str(tmpdir.mkdir("cache")))
+    gmsh_path = _fake_gmsh(tmpdir)
+    lines = []
+
+    def run():
+        return pygmsh.generate_mesh_async(
+            geom,
+            gmsh_path=gmsh_path,
+            cache=cache,
+            parameters={"w": 2.0},
+            only_physical=["plate"],
+            index_dtype=numpy.int32,
+            log_callback=lambda event: lines.append(event["message"]),
+        )
+
+    loop = asyncio.new_event_loop()
+    try:
+        _, cells, _, _, _ = loop.run_until_complete(run())
+        assert cells["triangle"].dtype == numpy.int32
+        assert any("-setnumber w 2.0" in line for line in lines)
+        assert "Mesh.SaveAll = 0;" in lines
+
+        # from the cache
+        os.remove(gmsh_path)
+        del lines[:]
+        _, cells, _, _, _ = loop.run_until_complete(run())
+        assert numpy.array_equal(cells["triangle"], [[0, 1, 2], [0, 2, 3]])
+        assert not lines
+    finally:
+        loop.close()
+    return
+
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+import pygmsh
+
+from helpers import compute_volume
+from test_msh_io import _fake_gmsh
+
+
+def test():
+    radii = [0.5, 1.0, 1.5, 2.0]
+    geoms = []
+    for radius in radii:
+        geom = pygmsh.built_in.Geometry()
+        geom.add_circle([0.0, 0.0, 0.0], radius, lcar=0.05)
+        geoms.append(geom)
+
+    # A broken geometry must not abort the batch.
+    broken = pygmsh.built_in.Geometry()
+    broken.add_raw_code("This is not Gmsh code;")
+    geoms.append(broken)
+
+    results = list(pygmsh.generate_meshes(geoms, workers=2, ordered=True))
+    assert [k for k, _, _ in results] == list(range(len(geoms)))
+
+    for radius, (_, mesh, error) in zip(radii, results):
+        assert error is None
+        points, cells, _, _, _ = mesh
+        ref = 3.14159 * radius ** 2
+        assert abs(compute_volume(points, cells) - ref) < 1.0e-2 * ref
+
+    _, mesh, error = results[-1]
+    assert mesh is None
+    assert error is not None
+    return
+
+
+def test_lazy(tmpdir):
+    created = []
+
+    def geometries():
+        for _ in range(20):
+            created.append(True)
+            geom = pygmsh.built_in.Geometry()
+            geom.add_rectangle(0.0, 1.0, 0.0, 1.0, 0.0, 0.1)
+            yield geom
+
+    results = pygmsh.generate_meshes(
+        geometries(), workers=1, ordered=True, gmsh_path=_fake_gmsh(tmpdir)
+    )
+    k, mesh, error = next(results)
+    assert k == 0
+    assert error is None
+    # Only a few geometries are generated ahead of the results.
+    assert len(created) <= 3
+    results.close()
+
+    results = pygmsh.generate_meshes(
+        geometries(), workers=2, gmsh_path=_fake_gmsh(tmpdir)
+    )
+    assert sorted(k for k, _, _ in results) == list(range(20))
+    return
+
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+import os
+
+import meshio
+import numpy
+
+import pygmsh
+
+from helpers import compute_volume
+from test_msh_io import _fake_gmsh
+
+
+def test_roundtrip(tmpdir):
+    cache = pygmsh.MeshCache(str(tmpdir))
+    mesh = meshio.Mesh(
+        numpy.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]]),
+        {"triangle": numpy.array([[0, 1, 2]])},
+        point_data={"u": numpy.array([1.0, 2.0, 3.0])},
+        cell_data={"triangle": {"gmsh:physical": numpy.array([4])}},
+        field_data={"interior": numpy.array([4, 2])},
+    )
+    key = cache.key("Point(1) = {0, 0, 0};", 2, [], "4.0.0", "msh")
+    assert cache.load(key) is None
+
+    cache.store(key, mesh)
+    out = cache.load(key)
+    assert numpy.array_equal(out.points, mesh.points)
+    assert numpy.array_equal(out.cells["triangle"], mesh.cells["triangle"])
+    assert numpy.array_equal(out.point_data["u"], mesh.point_data["u"])
+    assert numpy.array_equal(
+        out.cell_data["triangle"]["gmsh:physical"],
+        mesh.cell_data["triangle"]["gmsh:physical"],
+    )
+    assert numpy.array_equal(out.field_data["interior"], mesh.field_data["interior"])
+    return
+
+
+def test_eviction(tmpdir):
+    cache = pygmsh.MeshCache(str(tmpdir), max_bytes=0)
+    mesh = meshio.Mesh(numpy.zeros((3, 3)), {"triangle": numpy.array([[0, 1, 2]])})
+    key = cache.key("", 2, [], "4.0.0", "msh")
+    cache.store(key, mesh)
+    assert cache.load(key) is None
+    assert not os.listdir(str(tmpdir))
+    return
+
+
+def test_generate_mesh(tmpdir):
+    cache = pygmsh.MeshCache(str(tmpdir))
+    geom = pygmsh.built_in.Geometry()
+    geom.add_circle([0.0, 0.0, 0.0], 1.0, lcar=0.1)
+
+    ref = 3.1363871677682247
+    for _ in range(2):
+        points, cells, _, _, _ = pygmsh.generate_mesh(geom, cache=cache)
+        assert abs(compute_volume(points, cells) - ref) < 1.0e-2 * ref
+    assert len(os.listdir(str(tmpdir))) == 1
+    return
+
+
+def test_dtypes(tmpdir):
+    cache = pygmsh.MeshCache(str(tmpdir.mkdir("cache")))
+    gmsh_path = _fake_gmsh(tmpdir)
+    geom = pygmsh.built_in.Geometry()
+    geom.add_rectangle(0.0, 1.0, 0.0, 1.0, 0.0, 0.1)
+
+    points, cells, _, _, _ = pygmsh.generate_mesh(
+        geom,
+        cache=cache,
+        gmsh_path=gmsh_path,
+        index_dtype=numpy.int32,
+        coord_dtype=numpy.float32,
+        verbose=False,
+    )
+    assert points.dtype == numpy.float32
+    assert cells["triangle"].dtype == numpy.int32
+
+    # From the cache, with the default types
+    os.remove(gmsh_path)
+    points, cells, _, _, _ = pygmsh.generate_mesh(
+        geom, cache=cache, gmsh_path=gmsh_path, verbose=False
+    )
+    assert points.dtype == numpy.float64
+    assert cells["triangle"].dtype != numpy.int32
+    assert numpy.array_equal(cells["triangle"], [[0, 1, 2], [0, 2, 3]])
+
+    points, cells, _, _, _ = pygmsh.generate_mesh(
+        geom,
+        cache=cache,
+        gmsh_path=gmsh_path,
+        index_dtype=numpy.int32,
+        coord_dtype=numpy.float32,
+        verbose=False,
+    )
+    assert points.dtype == numpy.float32
+    assert cells["triangle"].dtype == numpy.int32
+    return
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+#
+import os
+import stat
+import sys
+
+import pytest
+
+import pygmsh
+
+from helpers import compute_volume
+
+
+def _geometry(characteristic_length_max):
+    geom = pygmsh.opencascade.Geometry(
+        characteristic_length_min=0.05,
+        characteristic_length_max=characteristic_length_max,
+    )
+    box = geom.add_box([0.0, 0.0, 0.0], [1.0, 1.0, 1.0])
+    ball = geom.add_ball([1.0, 1.0, 1.0], 0.5)
+    geom.boolean_difference([box], [ball])
+    return geom
+
+
+def test(tmpdir):
+    directory = str(tmpdir)
+    ref = 1.0 - 0.125 * 4.0 / 3.0 * 3.141592653589793 * 0.5 ** 3
+    geom = _geometry(0.2)
+    num_cells = []
+    for characteristic_length_max in [0.2, 0.1]:
+        geom.characteristic_length_max = characteristic_length_max
+        points, cells, _, _, _ = pygmsh.generate_mesh(geom, checkpoint_dir=directory)
+        assert abs(compute_volume(points, cells) - ref) < 1.0e-2 * ref
+        num_cells.append(len(cells["tetra"]))
+    # one checkpoint for both meshes
+    assert len(os.listdir(directory)) == 1
+    assert num_cells[1] > num_cells[0]
+    return
+
+
+def test_code():
+    geom = _geometry(0.1)
+    code = geom.get_code()
+    assert "Mesh.CharacteristicLengthMax = 0.1;" in code
+    model_code = geom._get_model_code()
+    assert "Mesh.CharacteristicLengthMax" not in model_code
+    geom.characteristic_length_max = 0.2
+    assert "Mesh.CharacteristicLengthMax = 0.2;" in geom.get_code()
+    assert geom._get_model_code() == model_code
+    return
+
+
+def test_refuse(tmpdir):
+    geom = _geometry(0.1)
+    geom.add_physical_volume(geom.add_box([2.0, 0.0, 0.0], [1.0, 1.0, 1.0]))
+    with pytest.raises(AssertionError) as excinfo:
+        pygmsh.generate_mesh(geom, checkpoint_dir=str(tmpdir))
+    assert "Physical Volume" in str(excinfo.value)
+    return
+
+
+def test_failed_export(tmpdir):
+    # A Gmsh that can't write the file, but exits with 0
+    gmsh_path = str(tmpdir.join("gmsh"))
+    with open(gmsh_path, "w") as f:
+        f.write(
+            "#!{}\n"
+            "import sys\n"
+            "if '--version' in sys.argv:\n"
+            "    print('4.11.1')\n"
+            "    sys.exit(0)\n"
+            "print(' '.join(sys.argv[1:]))\n"
+            "print('Error   : Unknown output file format')\n".format(sys.executable)
+        )
+    os.chmod(gmsh_path, os.stat(gmsh_path).st_mode | stat.S_IXUSR)
+
+    directory = tmpdir.mkdir("checkpoints")
+    with pytest.raises(pygmsh.GmshError) as excinfo:
+        pygmsh.generate_mesh(
+            _geometry(0.1), checkpoint_dir=str(directory), gmsh_path=gmsh_path
+        )
+    assert "Unknown output file format" in str(excinfo.value)
+    # The format is taken from the extension.
+    command = excinfo.value.log_tail[0].split()
+    assert "-format" not in command
+    assert command[command.index("-o") + 1].endswith(".brep")
+    # Nothing is cached.
+    assert not directory.listdir()
+    return
+
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+#
+import pygmsh
+
+
+def test():
+    geom = pygmsh.built_in.Geometry()
+    assert geom.dimension == 0
+    geom.add_point([0.0, 0.0, 0.0], 0.1)
+    assert geom.dimension == 0
+    geom.add_rectangle(0.0, 1.0, 0.0, 1.0, 0.0, 0.1)
+    assert geom.dimension == 2
+
+    poly = geom.add_polygon(
+        [[2.0, 0.0, 0.0], [3.0, 0.0, 0.0], [3.0, 1.0, 0.0]], make_surface=False
+    )
+    assert geom.dimension == 2
+    geom.extrude(poly.line_loop.lines[0], [0.0, 0.0, 1.0])
+    assert geom.dimension == 2
+
+    geom = pygmsh.built_in.Geometry()
+    geom.add_circle([0.0, 0.0, 0.0], 1.0, 0.1, make_surface=False)
+    assert geom.dimension == 1
+
+    geom = pygmsh.built_in.Geometry()
+    circle = geom.add_circle([0.0, 0.0, 0.0], 1.0, 0.1)
+    geom.extrude(circle.plane_surface, [0.0, 0.0, 1.0])
+    assert geom.dimension == 3
+
+    geom = pygmsh.built_in.Geometry()
+    geom.add_raw_code("Point(1) = {0, 0, 0};")
+    assert geom.dimension == 3
+
+    geom = pygmsh.opencascade.Geometry()
+    geom.add_disk([0.0, 0.0, 0.0], 1.0)
+    assert geom.dimension == 2
+    geom.add_ball([0.0, 0.0, 0.0], 1.0)
+    assert geom.dimension == 3
+    return
+
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+#
+import numpy
+
+import pygmsh
+
+
+def test():
+    geom = pygmsh.built_in.Geometry()
+    poly = geom.add_polygon([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]], 0.1)
+    geom.add_raw_code("// raw")
+
+    # The geometry keeps the entities, not their code.
+    assert poly.surface in geom._GMSH_CODE
+    assert "// raw" in geom._GMSH_CODE
+
+    code = geom.get_code()
+    assert poly.surface.code in code
+    assert "Plane Surface({}) = {{{}}};".format(
+        poly.surface.id, poly.line_loop.id
+    ) in code
+
+    geom = pygmsh.opencascade.Geometry()
+    ball = geom.add_ball([0.0, 0.0, 0.0], 1.0, x0=-0.5, char_length=0.1)
+    assert "Sphere({}) = {{0.0, 0.0, 0.0, 1.0, -0.5}};".format(ball.id) in (
+        geom.get_code()
+    )
+    assert geom.get_code().endswith(ball.code)
+    return
+
+
+def test_reused_buffer():
+    # The entities copy their input; it may be changed before the code is
+    # rendered.
+    geom = pygmsh.built_in.Geometry()
+    x = numpy.zeros(3)
+    points = []
+    for k in range(3):
+        x[0] = k
+        points.append(geom.add_point(x, 0.1))
+    X = numpy.zeros((2, 3))
+    point_set = geom.add_points(X, 0.1)
+    X[:] = 1.0
+    code = geom.get_code()
+    for k, p in enumerate(points):
+        assert "Point({}) = {{{!r}, 0.0, 0.0, 0.1}};".format(p.id, float(k)) in code
+    assert "Point({}+1) = {{0.0, 0.0, 0.0, 0.1}};".format(point_set.id) in code
+
+    geom = pygmsh.opencascade.Geometry()
+    x0 = [0.0, 0.0, 0.0]
+    box = geom.add_box(x0, [1.0, 1.0, 1.0])
+    x0[0] = 5.0
+    assert "Box({}) = {{0.0, 0.0, 0.0, 1.0, 1.0, 1.0}};".format(box.id) in (
+        geom.get_code()
+    )
+    return
+
+
+if __name__ == "__main__":
+    test()
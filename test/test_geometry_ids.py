@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+#
+from multiprocessing.pool import ThreadPool
+
+import pygmsh
+
+
+def _code(k):
+    geom = pygmsh.built_in.Geometry()
+    circle = geom.add_circle([0.0, 0.0, 0.0], 1.0, 0.1, make_surface=False)
+    geom.add_rectangle(-2.0, 2.0, -2.0, 2.0, 0.0, 0.1, holes=[circle.line_loop])
+    geom_occ = pygmsh.opencascade.Geometry()
+    geom_occ.add_ball([0.0, 0.0, 0.0], 1.0 + k)
+    return geom.get_code(), geom_occ.get_code()
+
+
+def test():
+    # ids start from 0 in every Geometry
+    code, code_occ = _code(0)
+    assert "p0 = newp;" in code
+    assert "vol0 = newv;" in code_occ
+    assert _code(0) == (code, code_occ)
+
+    pool = ThreadPool(4)
+    codes = pool.map(_code, [0] * 16)
+    pool.close()
+    assert all(c == (code, code_occ) for c in codes)
+    return
+
+
+if __name__ == "__main__":
+    test()
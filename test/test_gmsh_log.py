@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+#
+import pickle
+
+from pygmsh.gmsh_log import GmshError, GmshLog, parse_line
+
+
+def test():
+    events = []
+    log = GmshLog(callback=events.append, tail_size=3)
+    for line in [
+        "Info    : Meshing 2D...\n",
+        "Info    : [ 40%] Meshing surface 3 (Plane, Frontal-Delaunay)\n",
+        "Warning : Degenerate curve 4\n",
+        "Error   : Invalid boundary mesh (overlapping facets) on surface 3\n",
+        "Info    : Done meshing 2D (Wall 0.01s, CPU 0.01s)\n",
+    ]:
+        log(line)
+
+    assert [e["level"] for e in events] == [
+        "info",
+        "info",
+        "warning",
+        "error",
+        "info",
+    ]
+    assert all(e["phase"] == "2D" for e in events)
+    assert events[1]["progress"] == 40
+    assert events[1]["message"] == "Meshing surface 3 (Plane, Frontal-Delaunay)"
+    assert events[0]["progress"] is None
+
+    err = log.error("Gmsh exited with error (return code 1).", returncode=1)
+    assert isinstance(err, GmshError)
+    assert err.returncode == 1
+    assert len(err.log_tail) == 3
+    assert "overlapping facets" in str(err)
+
+    # errors cross process boundaries
+    err2 = pickle.loads(pickle.dumps(err))
+    assert err2.log_tail == err.log_tail
+    assert err2.returncode == 1
+    return
+
+
+def test_parse_line():
+    event = parse_line("Info    : Optimizing mesh...")
+    assert event["phase"] == "optimize"
+    event = parse_line("some banner line")
+    assert event["level"] == "info"
+    assert event["message"] == "some banner line"
+    return
+
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+#
+import numpy
+import pytest
+
+import pygmsh
+from pygmsh.hierarchy import _get_vertex_map
+
+from helpers import compute_volume
+
+
+def test():
+    geom = pygmsh.built_in.Geometry()
+    geom.add_rectangle(0.0, 1.0, 0.0, 1.0, 0.0, 0.25)
+
+    meshes, vertex_maps = pygmsh.generate_mesh_hierarchy(geom, 2)
+    assert len(meshes) == 3
+    assert len(vertex_maps) == 2
+
+    ref = 1.0
+    for k, mesh in enumerate(meshes):
+        points, cells, _, _, _ = mesh
+        assert abs(compute_volume(points, cells) - ref) < 1.0e-2 * ref
+        if k > 0:
+            # uniform refinement splits every triangle into four
+            assert len(cells["triangle"]) == 4 * len(meshes[k - 1][1]["triangle"])
+
+    for (coarse, _, _, _, _), (fine, _, _, _, _), vertex_map in zip(
+        meshes[:-1], meshes[1:], vertex_maps
+    ):
+        assert numpy.array_equal(fine[vertex_map], coarse)
+    return
+
+
+def test_dtypes_in_process():
+    pytest.importorskip("gmsh")
+
+    geom = pygmsh.built_in.Geometry()
+    geom.add_rectangle(0.0, 1.0, 0.0, 1.0, 0.0, 0.25)
+    meshes, vertex_maps = pygmsh.generate_mesh_hierarchy(
+        geom,
+        1,
+        in_process=True,
+        index_dtype=numpy.int32,
+        coord_dtype=numpy.float32,
+    )
+    for points, cells, _, _, _ in meshes:
+        assert points.dtype == numpy.float32
+        assert cells["triangle"].dtype == numpy.int32
+    assert numpy.array_equal(meshes[1][0][vertex_maps[0]], meshes[0][0])
+    return
+
+
+def test_vertex_map():
+    fine = numpy.array(
+        [[0.5, 0.0, 0.0], [0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]]
+    )
+    coarse = fine[[2, 1, 3]]
+    assert numpy.array_equal(_get_vertex_map(coarse, fine), [2, 1, 3])
+    return
+
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+import numpy
+import pytest
+
+import pygmsh
+
+from helpers import compute_volume
+
+
+def test():
+    pytest.importorskip("gmsh")
+
+    geom = pygmsh.built_in.Geometry()
+    circle = geom.add_circle([0.0, 0.0, 0.0], 1.0, lcar=0.1)
+    geom.add_physical_surface(circle.plane_surface, label="disk")
+
+    ref = 3.1363871677682247
+    points, cells, _, cell_data, field_data = pygmsh.generate_mesh(
+        geom, in_process=True
+    )
+    assert abs(compute_volume(points, cells) - ref) < 1.0e-2 * ref
+    assert "disk" in field_data
+    assert numpy.all(
+        cell_data["triangle"]["gmsh:physical"] == field_data["disk"][0]
+    )
+    return
+
+
+def test_backends():
+    pytest.importorskip("gmsh")
+
+    # with and without physical groups
+    for with_physical in [False, True]:
+        geom = pygmsh.built_in.Geometry()
+        circle = geom.add_circle([0.0, 0.0, 0.0], 1.0, lcar=0.1)
+        if with_physical:
+            geom.add_physical_surface(circle.plane_surface, label="disk")
+
+        meshes = [
+            pygmsh.generate_mesh(geom, in_process=in_process)
+            for in_process in [False, True]
+        ]
+        (_, cells0, _, cell_data0, field_data0) = meshes[0]
+        (_, cells1, _, cell_data1, field_data1) = meshes[1]
+        assert set(cells0) == set(cells1)
+        assert set(field_data0) == set(field_data1)
+        for key in cells0:
+            assert len(cells0[key]) == len(cells1[key])
+            assert set(cell_data0[key]) == set(cell_data1[key])
+            for name in cell_data0[key]:
+                assert numpy.array_equal(
+                    numpy.unique(cell_data0[key][name]),
+                    numpy.unique(cell_data1[key][name]),
+                )
+    return
+
+
+if __name__ == "__main__":
+    test()
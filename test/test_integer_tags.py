@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+#
+import pygmsh
+
+from helpers import compute_volume
+
+
+def _geometry(integer_tags):
+    geom = pygmsh.built_in.Geometry(integer_tags=integer_tags)
+    inner = geom.add_circle([0.5, 0.5, 0.0], 0.2, 0.05, make_surface=False)
+    geom.add_rectangle(0.0, 1.0, 0.0, 1.0, 0.0, 0.05, holes=[inner.line_loop])
+    return geom
+
+
+def test():
+    ref = 1.0 - 3.141592653589793 * 0.2 ** 2
+    meshes = []
+    for integer_tags in [False, True]:
+        points, cells, _, cell_data, _ = pygmsh.generate_mesh(_geometry(integer_tags))
+        assert abs(compute_volume(points, cells) - ref) < 1.0e-2 * ref
+        meshes.append((points, cells, cell_data))
+    # identical meshing results
+    assert len(meshes[0][0]) == len(meshes[1][0])
+    assert len(meshes[0][1]["triangle"]) == len(meshes[1][1]["triangle"])
+    return
+
+
+def test_code():
+    code = _geometry(True).get_code()
+    assert "newp" not in code
+    assert "newl" not in code
+    assert "Point(1) = {" in code
+    assert "Line Loop(2) = {" in code
+    assert "Plane Surface(1) = {2,1};" in code
+
+    geom = pygmsh.built_in.Geometry(integer_tags=True)
+    poly = geom.add_polygon([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]], 0.1)
+    geom.extrude(poly.surface, [0.0, 0.0, 1.0])
+    # Gmsh chooses the tags in the extrusion, so go back to variables
+    p = geom.add_point([2.0, 0.0, 0.0], 0.1)
+    assert not p.id.isdigit()
+    assert "{} = newp;".format(p.id) in geom.get_code()
+    return
+
+
+if __name__ == "__main__":
+    test()
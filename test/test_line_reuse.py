@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+#
+import numpy
+
+import pygmsh
+
+from helpers import compute_volume
+
+
+def _tiles(n):
+    geom = pygmsh.built_in.Geometry(point_tolerance=1.0e-10)
+    for i in range(n):
+        for j in range(n):
+            geom.add_rectangle(i, i + 1, j, j + 1, 0.0, 0.2)
+    return geom
+
+
+def test():
+    points, cells, _, _, _ = pygmsh.generate_mesh(_tiles(3), prune_vertices=False)
+    assert abs(compute_volume(points, cells) - 9.0) < 1.0e-10
+    # conforming: the tiles share the vertices on their common edges
+    assert len(numpy.unique(points.round(12), axis=0)) == len(points)
+    return
+
+
+def test_code():
+    geom = pygmsh.built_in.Geometry()
+    p0 = geom.add_point([0.0, 0.0, 0.0])
+    p1 = geom.add_point([1.0, 0.0, 0.0])
+    line = geom.add_line(p0, p1)
+    assert geom.add_line(p0, p1) is line
+    neg = geom.add_line(p1, p0)
+    assert neg.id == "-" + line.id
+    assert geom.get_code().count("Line(") == 1
+
+    # 3 x 3 tiles: 24 edges instead of 36
+    code = _tiles(3).get_code()
+    assert code.count("Line(") == 24
+    assert code.count("Line Loop(") == 9
+    return
+
+
+if __name__ == "__main__":
+    test()
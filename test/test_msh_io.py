@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+import os
+import stat
+import sys
+
+import numpy
+import pytest
+
+import pygmsh
+from pygmsh import msh_io
+
+
+def _write_msh41(filename):
+    """Writes two triangles in a physical group "disk", plus a boundary line
+    without a physical group, as binary msh 4.1.
+    """
+    size_t = numpy.uint64
+    with open(filename, "wb") as f:
+        f.write(b"$MeshFormat\n4.1 1 8\n")
+        f.write(numpy.array([1], dtype=numpy.int32).tobytes())
+        f.write(b"\n$EndMeshFormat\n")
+        f.write(b'$PhysicalNames\n1\n2 7 "disk"\n$EndPhysicalNames\n')
+
+        f.write(b"$Entities\n")
+        f.write(numpy.array([0, 1, 1, 0], dtype=size_t).tobytes())
+        # curve 3: no physical tags, no bounding points
+        f.write(numpy.array([3], dtype=numpy.int32).tobytes())
+        f.write(numpy.zeros(6).tobytes())
+        f.write(numpy.array([0, 0], dtype=size_t).tobytes())
+        # surface 1: physical tag 7, no bounding curves
+        f.write(numpy.array([1], dtype=numpy.int32).tobytes())
+        f.write(numpy.zeros(6).tobytes())
+        f.write(numpy.array([1], dtype=size_t).tobytes())
+        f.write(numpy.array([7], dtype=numpy.int32).tobytes())
+        f.write(numpy.array([0], dtype=size_t).tobytes())
+        f.write(b"\n$EndEntities\n")
+
+        # Nodes with sparse tags in two blocks
+        f.write(b"$Nodes\n")
+        f.write(numpy.array([2, 4, 2, 20], dtype=size_t).tobytes())
+        f.write(numpy.array([1, 3, 0], dtype=numpy.int32).tobytes())
+        f.write(numpy.array([2], dtype=size_t).tobytes())
+        f.write(numpy.array([20, 2], dtype=size_t).tobytes())
+        f.write(numpy.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0]]).tobytes())
+        f.write(numpy.array([2, 1, 0], dtype=numpy.int32).tobytes())
+        f.write(numpy.array([2], dtype=size_t).tobytes())
+        f.write(numpy.array([5, 9], dtype=size_t).tobytes())
+        f.write(numpy.array([[1.0, 1.0, 0.0], [0.0, 1.0, 0.0]]).tobytes())
+        f.write(b"\n$EndNodes\n")
+
+        f.write(b"$Elements\n")
+        f.write(numpy.array([2, 3, 1, 3], dtype=size_t).tobytes())
+        f.write(numpy.array([1, 3, 1], dtype=numpy.int32).tobytes())
+        f.write(numpy.array([1], dtype=size_t).tobytes())
+        f.write(numpy.array([1, 20, 2], dtype=size_t).tobytes())
+        f.write(numpy.array([2, 1, 2], dtype=numpy.int32).tobytes())
+        f.write(numpy.array([2], dtype=size_t).tobytes())
+        f.write(numpy.array([2, 20, 2, 5, 3, 20, 5, 9], dtype=size_t).tobytes())
+        f.write(b"\n$EndElements\n")
+    return
+
+
+def _fake_gmsh(tmpdir):
+    """Writes an executable that answers like `gmsh` and writes the mesh of
+    :func:`_write_msh41` for every geo file it's given. It prints its
+    arguments and the geo file.
+    """
+    msh_filename = str(tmpdir.join("fake.msh"))
+    _write_msh41(msh_filename)
+    filename = str(tmpdir.join("gmsh"))
+    with open(filename, "w") as f:
+        f.write(
+            "#!{}\n"
+            "import shutil\n"
+            "import sys\n"
+            "if '--version' in sys.argv:\n"
+            "    print('4.4.1')\n"
+            "    sys.exit(0)\n"
+            "print(' '.join(sys.argv[1:]))\n"
+            "print(open(sys.argv[2]).read())\n"
+            "shutil.copy({!r}, sys.argv[sys.argv.index('-o') + 1])\n".format(
+                sys.executable, msh_filename
+            )
+        )
+    os.chmod(filename, os.stat(filename).st_mode | stat.S_IXUSR)
+    return filename
+
+
+def test(tmpdir):
+    filename = str(tmpdir.join("test.msh"))
+    _write_msh41(filename)
+    mesh = msh_io.read(filename)
+
+    assert numpy.array_equal(
+        mesh.points,
+        [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0], [0.0, 1.0, 0.0]],
+    )
+    assert numpy.array_equal(mesh.cells["line"], [[0, 1]])
+    assert numpy.array_equal(mesh.cells["triangle"], [[0, 1, 2], [0, 2, 3]])
+    assert numpy.array_equal(mesh.cell_data["line"]["gmsh:physical"], [0])
+    assert numpy.array_equal(mesh.cell_data["line"]["gmsh:geometrical"], [3])
+    assert numpy.array_equal(mesh.cell_data["triangle"]["gmsh:physical"], [7, 7])
+    assert numpy.array_equal(mesh.cell_data["triangle"]["gmsh:geometrical"], [1, 1])
+    assert numpy.array_equal(mesh.field_data["disk"], [7, 2])
+    return
+
+
+def test_dtypes(tmpdir):
+    filename = str(tmpdir.join("test.msh"))
+    _write_msh41(filename)
+    mesh = msh_io.read(filename, index_dtype=numpy.int32, coord_dtype=numpy.float32)
+    assert mesh.points.dtype == numpy.float32
+    assert mesh.cells["triangle"].dtype == numpy.int32
+    assert numpy.array_equal(mesh.cells["triangle"], [[0, 1, 2], [0, 2, 3]])
+
+    with pytest.raises(ValueError):
+        msh_io.check_index_dtype(numpy.int8, 129)
+    msh_io.check_index_dtype(numpy.int8, 128)
+    return
+
+
+def test_generate_mesh(tmpdir):
+    geom = pygmsh.built_in.Geometry()
+    geom.add_rectangle(0.0, 1.0, 0.0, 1.0, 0.0, 0.1)
+    points, cells, _, cell_data, field_data = pygmsh.generate_mesh(
+        geom, gmsh_path=_fake_gmsh(tmpdir), verbose=False
+    )
+    assert numpy.array_equal(
+        points, [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0], [0.0, 1.0, 0.0]]
+    )
+    assert numpy.array_equal(cells["triangle"], [[0, 1, 2], [0, 2, 3]])
+    assert numpy.array_equal(cell_data["triangle"]["gmsh:physical"], [7, 7])
+    assert numpy.array_equal(field_data["disk"], [7, 2])
+    return
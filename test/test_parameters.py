@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+#
+from math import pi
+
+import pygmsh
+
+from helpers import compute_volume
+
+
+def _geometry():
+    geom = pygmsh.built_in.Geometry()
+    r = geom.parameter("r", 1.0)
+    lcar = geom.parameter("lcar", 0.1)
+    geom.add_circle([0.0, 0.0, 0.0], r, lcar=lcar * r)
+    return geom
+
+
+def test():
+    geom = _geometry()
+    for r in [1.0, 0.5]:
+        points, cells, _, _, _ = pygmsh.generate_mesh(geom, parameters={"r": r})
+        ref = pi * r ** 2
+        assert abs(compute_volume(points, cells) - ref) < 1.0e-2 * ref
+
+    sweep = pygmsh.generate_mesh_sweep(geom, [{"r": 0.5}, {"r": 2.0}], workers=2)
+    areas = {}
+    for k, mesh, error in sweep:
+        assert error is None
+        areas[k] = compute_volume(mesh[0], mesh[1])
+    assert abs(areas[1] - 16 * areas[0]) < 1.0e-2 * areas[1]
+    return
+
+
+def test_code():
+    geom = _geometry()
+    code = geom.get_code()
+    assert 'DefineConstant[ r = {1.0, Name "Parameters/r"} ];' in code
+    # parametric coordinates and mesh sizes
+    assert "Point(p1) = {r, 0.0, 0.0, (lcar * r)};" in code
+    assert "Point(p2) = {(r * -0.4999999999999998), (r * 0.8660254037844387)," in code
+
+    r = pygmsh.built_in.parameter.Expression("r")
+    assert str(2 * r + 1) == "((2.0 * r) + 1.0)"
+    assert str(-r / 2 - r ** 2) == "(((-r) / 2.0) - (r ^ 2.0))"
+    assert r + 0 is r
+    assert 0 * r == 0.0
+    return
+
+
+def test_polygon():
+    geom = pygmsh.built_in.Geometry()
+    w = geom.parameter("w", 2.0)
+    h = geom.parameter("h", 0.1)
+    rectangle = geom.add_rectangle(0.0, w, 0.0, 1.0, 0.0, lcar=h)
+    code = geom.get_code()
+    ids = [line.points[0].id for line in rectangle.line_loop.lines]
+    assert "Point({}) = {{0.0, 0.0, 0.0, h}};".format(ids[0]) in code
+    assert "Point({}) = {{w, 0.0, 0.0, h}};".format(ids[1]) in code
+
+    points, cells, _, _, _ = pygmsh.generate_mesh(geom, parameters={"w": 3.0})
+    assert abs(compute_volume(points, cells) - 3.0) < 1.0e-10
+
+    geom = pygmsh.built_in.Geometry()
+    w = geom.parameter("w", 2.0)
+    h = geom.parameter("h", 0.1)
+    polygon = geom.add_polygon(
+        [[0.0, 0.0, 0.0], [w, 0.0, 0.0], [0.0, w / 2, 0.0]], lcar=[0.1, h, 0.2]
+    )
+    code = geom.get_code()
+    ids = [line.points[0].id for line in polygon.line_loop.lines]
+    assert "Point({}) = {{0.0, 0.0, 0.0, 0.1}};".format(ids[0]) in code
+    assert "Point({}) = {{w, 0.0, 0.0, h}};".format(ids[1]) in code
+    assert "Point({}) = {{0.0, (w / 2.0), 0.0, 0.2}};".format(ids[2]) in code
+    return
+
+
+if __name__ == "__main__":
+    test()
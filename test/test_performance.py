@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+#
+from pygmsh.performance import get_code, get_options
+
+
+def test():
+    options = dict(get_options("fast", num_threads=4))
+    assert options["Mesh.Algorithm3D"] == 10
+    assert options["General.NumThreads"] == 4
+    assert options["Mesh.MaxNumThreads3D"] == 4
+
+    # all cores by default
+    options = dict(get_options("quality"))
+    assert options["General.NumThreads"] > 0
+
+    assert get_options() == []
+    assert get_code(num_threads=2).split("\n") == [
+        "General.NumThreads = 2;",
+        "Mesh.MaxNumThreads1D = 2;",
+        "Mesh.MaxNumThreads2D = 2;",
+        "Mesh.MaxNumThreads3D = 2;",
+    ]
+    return
+
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+#
+import pytest
+
+import pygmsh
+
+
+def test():
+    geom = pygmsh.built_in.Geometry()
+    circle = geom.add_circle([0.0, 0.0, 0.0], 1.0, 0.1)
+    top, vol, _ = geom.extrude(circle.plane_surface, [0.0, 0.0, 1.0])
+    geom.add_physical_volume(vol, label="cylinder")
+    geom.add_physical_surface(top, label=7)
+    geom.add_physical_line(circle.line_loop.lines)
+
+    code = geom._get_physical_selection_code(dims=[3])
+    lines = code.split("\n")
+    assert lines[:2] == ["Delete Physicals;", "Mesh.SaveAll = 0;"]
+    assert lines[2:] == ['Physical Volume("cylinder") = {ex1[1]};']
+
+    code = geom._get_physical_selection_code(labels=[7, "cylinder"])
+    assert len(code.split("\n")) == 4
+
+    # Nothing selected; Gmsh would save all elements.
+    with pytest.raises(ValueError):
+        geom._get_physical_selection_code(labels=[7], dims=[3])
+    with pytest.raises(ValueError):
+        geom._get_physical_selection_code(dims=[0])
+
+    # no physical groups
+    geom = pygmsh.built_in.Geometry()
+    geom.add_rectangle(0.0, 1.0, 0.0, 1.0, 0.0, 0.1)
+    code = geom._get_physical_selection_code(dims=[2])
+    assert code.split("\n")[2:] == ["Physical Surface(1) = {Surface{:}};"]
+    with pytest.raises(ValueError):
+        geom._get_physical_selection_code(dims=[])
+    return
+
+
+def test_generate_mesh():
+    geom = pygmsh.built_in.Geometry()
+    circle = geom.add_circle([0.0, 0.0, 0.0], 1.0, 0.1)
+    top, vol, _ = geom.extrude(circle.plane_surface, [0.0, 0.0, 1.0])
+    geom.add_physical_volume(vol, label="cylinder")
+    geom.add_physical_surface(top, label=7)
+
+    points, cells, _, cell_data, _ = pygmsh.generate_mesh(geom, only_physical=[7])
+    assert list(cells.keys()) == ["triangle"]
+    assert (cell_data["triangle"]["gmsh:physical"] == 7).all()
+    # only the top surface
+    assert abs(points[:, 2] - 1.0).max() < 1.0e-12
+
+    points, cells, _, cell_data, _ = pygmsh.generate_mesh(geom, cell_dims=[3])
+    assert list(cells.keys()) == ["tetra"]
+    return
+
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+#
+import pygmsh
+
+from helpers import compute_volume
+
+
+def _tiles(geom, n):
+    for i in range(n):
+        for j in range(n):
+            geom.add_rectangle(i, i + 1, j, j + 1, 0.0, 0.2)
+    return
+
+
+def test():
+    geom = pygmsh.built_in.Geometry(point_tolerance=1.0e-10)
+    _tiles(geom, 3)
+    points, cells, _, _, _ = pygmsh.generate_mesh(geom)
+    assert abs(compute_volume(points, cells) - 9.0) < 1.0e-10
+    return
+
+
+def test_code():
+    geom = pygmsh.built_in.Geometry(point_tolerance=1.0e-3)
+    p0 = geom.add_point([0.0, 0.0, 0.0], 0.1)
+    assert geom.add_point([0.0, 5.0e-4, 0.0], 0.1) is p0
+    # in a neighboring cell of the spatial hash
+    assert geom.add_point([-1.0e-4, 0.0, 0.0], 0.1) is p0
+    assert geom.add_point([2.0e-3, 0.0, 0.0], 0.1) is not p0
+
+    points = geom.add_points([[1.0, 1.0, 0.0], [2.0, 2.0, 0.0]])
+    assert geom.add_point([1.0, 1.0, 0.0]) is points[0]
+
+    # one lcar per vertex
+    poly = geom.add_polygon(
+        [[0.0, 0.0, 0.0], [3.0, 0.0, 0.0], [3.0, 3.0, 0.0]], lcar=[0.1, 0.2, 0.3]
+    )
+    vertices = [line.points[0] for line in poly.line_loop.lines]
+    assert vertices[0] is p0
+    assert [p.lcar for p in vertices[1:]] == [0.2, 0.3]
+
+    geom = pygmsh.built_in.Geometry(point_tolerance=1.0e-10)
+    _tiles(geom, 3)
+    assert geom.get_code().count("newp;") == 16
+
+    geom = pygmsh.built_in.Geometry()
+    _tiles(geom, 3)
+    assert geom.get_code().count("newp;") == 9
+    return
+
+
+if __name__ == "__main__":
+    test()
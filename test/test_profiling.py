@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+#
+from pygmsh.profiling import Profiler
+
+
+def test():
+    profiler = Profiler()
+    with profiler.stage("gmsh"):
+        for line in [
+            "Info    : Meshing 1D...\n",
+            "Info    : Done meshing 1D (Wall 0.00312s, CPU 0.003s)\n",
+            "Info    : Done meshing 2D (Wall 0.0126s, CPU 0.012s)\n",
+            # Gmsh 3
+            "Info    : Done meshing 3D (0.25 s)\n",
+            "Info    : Done optimizing mesh (Wall 0.1s, CPU 0.2s)\n",
+        ]:
+            profiler.parse_gmsh_line(line)
+
+    report = profiler.report
+    assert set(report["stages"]) == {"gmsh"}
+    assert report["stages"]["gmsh"]["wall"] >= 0.0
+    assert report["gmsh"]["1D"] == {"wall": 0.00312, "cpu": 0.003}
+    assert report["gmsh"]["2D"] == {"wall": 0.0126, "cpu": 0.012}
+    assert report["gmsh"]["3D"] == {"wall": 0.25, "cpu": 0.25}
+    assert report["gmsh"]["optimize"] == {"wall": 0.1, "cpu": 0.2}
+    return
+
+
+if __name__ == "__main__":
+    test()
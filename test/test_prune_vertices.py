@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+import meshio
+import numpy
+
+from pygmsh.helpers import _prune_vertices
+
+
+def test():
+    points = numpy.array(
+        [[0.0, 0.0, 0.0], [9.0, 9.0, 9.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]]
+    )
+    mesh = meshio.Mesh(
+        points.copy(),
+        {"triangle": numpy.array([[0, 2, 3]]), "line": numpy.array([[3, 0]])},
+        point_data={"u": numpy.arange(4.0)},
+    )
+    _prune_vertices(mesh)
+    assert numpy.array_equal(mesh.points, points[[0, 2, 3]])
+    assert numpy.array_equal(mesh.cells["triangle"], [[0, 1, 2]])
+    assert numpy.array_equal(mesh.cells["line"], [[2, 0]])
+    assert numpy.array_equal(mesh.point_data["u"], [0.0, 2.0, 3.0])
+    return
+
+
+def test_all_used():
+    cells = numpy.array([[0, 1, 2]])
+    mesh = meshio.Mesh(numpy.zeros((3, 3)), {"triangle": cells})
+    _prune_vertices(mesh)
+    assert mesh.cells["triangle"] is cells
+    assert numpy.array_equal(cells, [[0, 1, 2]])
+    return
+
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+#
+import copy
+
+import pygmsh
+
+
+def test():
+    geom = pygmsh.built_in.Geometry()
+    points = [
+        geom.add_point([0.0, 0.0, 0.0]),
+        geom.add_point([1.0, 0.0, 0.0]),
+        geom.add_point([1.0, 1.0, 0.0]),
+    ]
+    spline = geom.add_spline(points)
+
+    neg = -spline
+    assert neg.id == "-" + spline.id
+    assert -neg is spline
+    # shares the data of the line
+    assert neg.points is spline.points
+    assert isinstance(neg, pygmsh.built_in.line_base.LineBase)
+
+    ll = geom.add_line_loop([spline, geom.add_line(points[2], points[0])])
+    ll2 = geom.add_line_loop([-geom.add_line(points[2], points[0]), -spline])
+    code = geom.get_code()
+    line = ll.lines[1]
+    assert "Line Loop({}) = {{{}, {}}};".format(ll.id, spline.id, line.id) in code
+    assert "Line Loop({}) = {{-{}, -{}}};".format(ll2.id, line.id, spline.id) in code
+
+    neg2 = copy.deepcopy(neg)
+    assert neg2.id == neg.id
+    return
+
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+import pygmsh
+
+from helpers import compute_volume
+
+
+def test():
+    pytest.importorskip("gmsh")
+
+    with pygmsh.GmshSession(num_workers=2) as session:
+        for radius in [0.5, 1.0]:
+            geom = pygmsh.built_in.Geometry()
+            geom.add_circle([0.0, 0.0, 0.0], radius, lcar=0.1)
+            points, cells, _, _, _ = pygmsh.generate_mesh(geom, session=session)
+            ref = 3.14159 * radius ** 2
+            assert abs(compute_volume(points, cells) - ref) < 1.0e-2 * ref
+    return
+
+
+def _circle():
+    geom = pygmsh.built_in.Geometry()
+    geom.add_circle([0.0, 0.0, 0.0], 1.0, lcar=0.1)
+    return geom
+
+
+def test_options_reset():
+    pytest.importorskip("gmsh")
+
+    with pygmsh.GmshSession() as session:
+        _, ref, _, _, _ = pygmsh.generate_mesh(_circle(), session=session)
+
+        geom = _circle()
+        geom.add_raw_code("Mesh.CharacteristicLengthMax = 0.02;")
+        _, cells, _, _, _ = pygmsh.generate_mesh(geom, session=session)
+        assert len(cells["triangle"]) > len(ref["triangle"])
+
+        # The option doesn't carry over into the next job.
+        _, cells, _, _, _ = pygmsh.generate_mesh(_circle(), session=session)
+        assert len(cells["triangle"]) == len(ref["triangle"])
+    return
+
+
+def test_dead_worker():
+    pytest.importorskip("gmsh")
+
+    with pygmsh.GmshSession() as session:
+        session._processes[0].terminate()
+        session._processes[0].join()
+        with pytest.raises(pygmsh.GmshError):
+            pygmsh.generate_mesh(_circle(), session=session)
+        # The worker has been replaced.
+        _, cells, _, _, _ = pygmsh.generate_mesh(_circle(), session=session)
+        assert len(cells["triangle"]) > 0
+    return
+
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+#
+import pygmsh
+
+
+def test():
+    geom = pygmsh.built_in.Geometry()
+    poly = geom.add_polygon([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]], 0.1)
+    p = geom.add_point([0.0, 0.0, 1.0], 0.1)
+    surface_loop = geom.add_surface_loop([poly.surface])
+    entities = [
+        p,
+        geom.add_line(p, poly.line_loop.lines[0].points[0]),
+        poly.line_loop,
+        poly.surface,
+        surface_loop,
+        geom.add_volume(surface_loop),
+    ]
+
+    geom_occ = pygmsh.opencascade.Geometry()
+    entities += [
+        geom_occ.add_ball([0.0, 0.0, 0.0], 1.0),
+        geom_occ.add_box([0.0, 0.0, 0.0], [1.0, 1.0, 1.0]),
+        geom_occ.add_disk([0.0, 0.0, 0.0], 1.0),
+    ]
+
+    # no per-instance dictionaries
+    for entity in entities:
+        assert not hasattr(entity, "__dict__"), type(entity).__name__
+    return
+
+
+if __name__ == "__main__":
+    test()
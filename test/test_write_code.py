@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+#
+import io
+
+import pygmsh
+
+
+def test():
+    geom = pygmsh.built_in.Geometry()
+    geom.add_circle([0.0, 0.0, 0.0], 1.0, 0.1, num_sections=8)
+    geom.add_raw_code("// raw")
+
+    geom_occ = pygmsh.opencascade.Geometry(characteristic_length_max=0.1)
+    geom_occ.add_ball([0.0, 0.0, 0.0], 1.0)
+    geom_occ.add_box([1.0, 0.0, 0.0], [1.0, 1.0, 1.0])
+
+    for g in [geom, geom_occ]:
+        for chunk_size in [1, 3, 1000]:
+            f = io.StringIO()
+            g.write_code(f, chunk_size=chunk_size)
+            assert f.getvalue() == g.get_code()
+    return
+
+
+if __name__ == "__main__":
+    test()